@@ -2,7 +2,13 @@
 File management and visualization routes
 """
 
-import aiofiles
+import asyncio
+import hashlib
+import os
+import re
+import stat
+from pathlib import Path
+
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 from fastapi.responses import FileResponse
 
@@ -12,28 +18,72 @@ from api.services.jss_service import JSSFileService
 # Create router
 router = APIRouter(prefix='/api/v1/files', tags=['File Management'])
 
+# Uploads are copied to disk in chunks of this size instead of being read whole
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Plain file names only: no path separators, no leading dot (rejects '..' and hidden files)
+_SAFE_NAME = re.compile(r'\A[A-Za-z0-9][A-Za-z0-9_.-]{0,254}\Z')
+# Controller uploads must additionally be '<name>.txt'; group 1 is the controller name
+_SAFE_CONTROLLER_FILENAME = re.compile(r'\A([A-Za-z0-9][A-Za-z0-9_.-]{0,250})\.txt\Z')
+
+
+def _file_digest(path: Path) -> bytes:
+	"""blake2b digest of a file on disk, read in upload-sized chunks"""
+	hasher = hashlib.blake2b(digest_size=16)
+	with open(path, 'rb') as f:
+		while chunk := f.read(UPLOAD_CHUNK_SIZE):
+			hasher.update(chunk)
+	return hasher.digest()
+
+
+async def _save_upload(file: UploadFile, path: Path) -> bool:
+	"""
+	Stream an upload to `path` (exclusive create), hashing it on the way.
+
+	Returns True if the file was written, False if `path` already holds identical
+	content (re-upload of the same file). Raises FileExistsError if `path` holds
+	different content.
+	"""
+	hasher = hashlib.blake2b(digest_size=16)
+	try:
+		f = await asyncio.to_thread(open, path, 'xb')
+	except FileExistsError:
+		while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+			hasher.update(chunk)
+		if await asyncio.to_thread(_file_digest, path) == hasher.digest():
+			return False
+		raise
+
+	try:
+		with f:
+			while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+				hasher.update(chunk)
+				await asyncio.to_thread(f.write, chunk)
+	except BaseException:
+		# Don't leave a truncated file behind that would block a retry
+		path.unlink(missing_ok=True)
+		raise
+	return True
+
 
 @router.post('/instances/upload')
 async def upload_instance(file: UploadFile = File(...), fs: JSSFileService = Depends(get_file_service)):
 	"""Upload a new JSS instance file"""
 	try:
 		# Validate file
-		if not file.filename:
-			raise HTTPException(status_code=400, detail='No filename provided')
-
-		# Check if instance already exists
-		if fs.instance_exists(file.filename):
-			raise HTTPException(status_code=409, detail=f"Instance '{file.filename}' already exists")
+		if not _SAFE_NAME.match(file.filename or ''):
+			raise HTTPException(status_code=400, detail='Invalid or missing filename')
 
-		# Save file
+		# Save file; identical re-uploads are accepted, different content is a conflict
 		instance_path = fs.instances_dir / file.filename
 
-		async with aiofiles.open(instance_path, 'wb') as f:
-			content = await file.read()
-			await f.write(content)
+		try:
+			created = await _save_upload(file, instance_path)
+		except FileExistsError:
+			raise HTTPException(status_code=409, detail=f"Instance '{file.filename}' already exists")
 
 		return {
-			'message': f"Instance '{file.filename}' uploaded successfully",
+			'message': f"Instance '{file.filename}' {'uploaded successfully' if created else 'already exists with identical content'}",
 			'path': str(instance_path),
 		}
 
@@ -48,27 +98,22 @@ async def upload_controller(file: UploadFile = File(...), fs: JSSFileService = D
 	"""Upload a new controller file"""
 	try:
 		# Validate file
-		if not file.filename:
-			raise HTTPException(status_code=400, detail='No filename provided')
+		match = _SAFE_CONTROLLER_FILENAME.match(file.filename or '')
+		if not match:
+			raise HTTPException(status_code=400, detail='Controller file must be a .txt file with a valid name')
 
-		if not file.filename.endswith('.txt'):
-			raise HTTPException(status_code=400, detail='Controller file must be a .txt file')
+		controller_name = match.group(1)
 
-		controller_name = file.filename[:-4]  # Remove .txt extension
-
-		# Check if controller already exists
-		if fs.controller_exists(controller_name):
-			raise HTTPException(status_code=409, detail=f"Controller '{controller_name}' already exists")
-
-		# Save file
+		# Save file; identical re-uploads are accepted, different content is a conflict
 		controller_path = fs.controllers_dir / file.filename
 
-		async with aiofiles.open(controller_path, 'wb') as f:
-			content = await file.read()
-			await f.write(content)
+		try:
+			created = await _save_upload(file, controller_path)
+		except FileExistsError:
+			raise HTTPException(status_code=409, detail=f"Controller '{controller_name}' already exists")
 
 		return {
-			'message': f"Controller '{controller_name}' uploaded successfully",
+			'message': f"Controller '{controller_name}' {'uploaded successfully' if created else 'already exists with identical content'}",
 			'path': str(controller_path),
 		}
 
@@ -82,11 +127,14 @@ async def upload_controller(file: UploadFile = File(...), fs: JSSFileService = D
 async def delete_instance(instance_name: str, fs: JSSFileService = Depends(get_file_service)):
 	"""Delete an instance file"""
 	try:
-		if not fs.instance_exists(instance_name):
-			raise HTTPException(status_code=404, detail=f"Instance '{instance_name}' not found")
+		if not _SAFE_NAME.match(instance_name):
+			raise HTTPException(status_code=400, detail=f"Invalid instance name '{instance_name}'")
 
 		instance_path = fs.instances_dir / instance_name
-		instance_path.unlink()
+		try:
+			instance_path.unlink()
+		except FileNotFoundError:
+			raise HTTPException(status_code=404, detail=f"Instance '{instance_name}' not found")
 
 		return {'message': f"Instance '{instance_name}' deleted successfully"}
 
@@ -100,11 +148,14 @@ async def delete_instance(instance_name: str, fs: JSSFileService = Depends(get_f
 async def delete_controller(controller_name: str, fs: JSSFileService = Depends(get_file_service)):
 	"""Delete a controller file"""
 	try:
-		if not fs.controller_exists(controller_name):
-			raise HTTPException(status_code=404, detail=f"Controller '{controller_name}' not found")
+		if not _SAFE_NAME.match(controller_name):
+			raise HTTPException(status_code=400, detail=f"Invalid controller name '{controller_name}'")
 
 		controller_path = fs.controllers_dir / f'{controller_name}.txt'
-		controller_path.unlink()
+		try:
+			controller_path.unlink()
+		except FileNotFoundError:
+			raise HTTPException(status_code=404, detail=f"Controller '{controller_name}' not found")
 
 		return {'message': f"Controller '{controller_name}' deleted successfully"}
 
@@ -118,15 +169,24 @@ async def delete_controller(controller_name: str, fs: JSSFileService = Depends(g
 async def download_instance(instance_name: str, fs: JSSFileService = Depends(get_file_service)):
 	"""Download an instance file"""
 	try:
-		if not fs.instance_exists(instance_name):
-			raise HTTPException(status_code=404, detail=f"Instance '{instance_name}' not found")
+		if not _SAFE_NAME.match(instance_name):
+			raise HTTPException(status_code=400, detail=f"Invalid instance name '{instance_name}'")
 
 		instance_path = fs.instances_dir / instance_name
+		# Stat up front so Content-Length is known and the response can use sendfile;
+		# the same stat doubles as the existence check
+		try:
+			stat_result = await asyncio.to_thread(os.stat, instance_path)
+		except FileNotFoundError:
+			stat_result = None
+		if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+			raise HTTPException(status_code=404, detail=f"Instance '{instance_name}' not found")
 
 		return FileResponse(
 			path=str(instance_path),
 			filename=instance_name,
 			media_type='application/octet-stream',
+			stat_result=stat_result,
 		)
 
 	except HTTPException:
@@ -139,15 +199,22 @@ async def download_instance(instance_name: str, fs: JSSFileService = Depends(get
 async def download_controller(controller_name: str, fs: JSSFileService = Depends(get_file_service)):
 	"""Download a controller file"""
 	try:
-		if not fs.controller_exists(controller_name):
-			raise HTTPException(status_code=404, detail=f"Controller '{controller_name}' not found")
+		if not _SAFE_NAME.match(controller_name):
+			raise HTTPException(status_code=400, detail=f"Invalid controller name '{controller_name}'")
 
 		controller_path = fs.controllers_dir / f'{controller_name}.txt'
+		try:
+			stat_result = await asyncio.to_thread(os.stat, controller_path)
+		except FileNotFoundError:
+			stat_result = None
+		if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+			raise HTTPException(status_code=404, detail=f"Controller '{controller_name}' not found")
 
 		return FileResponse(
 			path=str(controller_path),
 			filename=f'{controller_name}.txt',
 			media_type='text/plain',
+			stat_result=stat_result,
 		)
 
 	except HTTPException:
@@ -2,10 +2,21 @@
 JSS API Routes - Main endpoints for JSS operations
 """
 
-from typing import List, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse
+import asyncio
+import hashlib
+import os
+import time
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+import orjson
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi import Path as PathParam
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import FileResponse, ORJSONResponse
+from pydantic import BaseModel, ValidationError
 
 from api.schemas.jss_schemas import (
 	BackgroundTaskStatus,
@@ -18,90 +29,182 @@ from api.schemas.jss_schemas import (
 	SingleRunResult,
 	VisualizationRequest,
 )
-from api.services.jss_service import JSSExecutionService, JSSFileService
+from api.services.jss_service import JSSExecutionService, JSSFileService, TaskStoreFullError
 
 # Create router
 router = APIRouter(prefix='/api/v1', tags=['JSS Operations'])
 
-# Global services (will be initialized in main app)
-file_service: Optional[JSSFileService] = None
-execution_service: Optional[JSSExecutionService] = None
+# Relative result paths: '/'-separated segments that may not start with '.', so '..', hidden
+# files, empty segments and absolute paths are all rejected. Checked by pydantic-core at parse time.
+_RESULT_PATH_PATTERN = r'^[A-Za-z0-9_-][A-Za-z0-9_.-]*(/[A-Za-z0-9_-][A-Za-z0-9_.-]*)*$'
+
+# Serialized listing bodies keyed on (directory, include_stats) -> (listing signature, JSON bytes, ETag),
+# where the signature is the file service's (name, mtime_ns, size) per listed file
+_listing_body_cache: Dict[Tuple[Path, bool], Tuple[tuple, bytes, str]] = {}
 
 
-def get_file_service() -> JSSFileService:
-	"""Dependency to get file service"""
-	if file_service is None:
-		raise HTTPException(status_code=500, detail='Service not initialized')
-	return file_service
+async def get_file_service(request: Request) -> JSSFileService:
+	"""Dependency to get file service (async so FastAPI doesn't dispatch it to the threadpool)"""
+	return request.app.state.file_service
 
 
-def get_execution_service() -> JSSExecutionService:
+async def get_execution_service(request: Request) -> JSSExecutionService:
 	"""Dependency to get execution service"""
-	if execution_service is None:
-		raise HTTPException(status_code=500, detail='Service not initialized')
-	return execution_service
+	return request.app.state.execution_service
+
+
+RequestModel = TypeVar('RequestModel', bound=BaseModel)
+
+
+def _json_body(model: Type[RequestModel]) -> Callable[[Request], Any]:
+	"""
+	Dependency that parses the raw request body with model.model_validate_json.
+
+	pydantic-core parses and validates the JSON in one pass, instead of FastAPI's json.loads
+	followed by validation of the resulting dict. Errors are reported the same way (422, 'body' loc).
+	"""
+
+	async def parse(request: Request) -> RequestModel:
+		try:
+			return model.model_validate_json(await request.body())
+		except ValidationError as e:
+			raise RequestValidationError([{**error, 'loc': ('body', *error['loc'])} for error in e.errors(include_url=False)])
+
+	return parse
+
+
+def _json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+	"""openapi_extra documenting a body that is parsed by _json_body rather than by FastAPI"""
+	return {
+		'requestBody': {
+			'required': True,
+			'content': {'application/json': {'schema': model.model_json_schema()}},
+		}
+	}
+
+
+def _orjson_response(payload) -> ORJSONResponse:
+	"""
+	Dump a model (or list of models) once and return it as an ORJSONResponse.
+
+	Returning a Response skips FastAPI's response_model validation and jsonable_encoder
+	pass; response_model stays on the decorators for the OpenAPI schema only.
+	"""
+	if isinstance(payload, list):
+		return ORJSONResponse([item.model_dump() for item in payload])
+	return ORJSONResponse(payload.model_dump())
+
+
+@lru_cache(maxsize=2)
+def _iso_second(sec: int) -> str:
+	"""ISO timestamp for a whole second; cached so polling within the same second reuses it"""
+	return datetime.fromtimestamp(sec).isoformat()
+
+
+def _cached_listing_response(
+	request: Request,
+	directory: Path,
+	include_stats: bool,
+	get_listing: Callable[..., Tuple[list, tuple]],
+) -> Response:
+	"""
+	Return a listing as pre-serialized JSON, re-encoding only when a listed file changes.
+
+	The body is cached on the same file signature as the service's listing cache, so both are
+	invalidated together. Responses carry an ETag of the body and the file signature, so it changes
+	whenever any listed file's size or mtime does; a matching If-None-Match gets an empty 304.
+	"""
+	items, signature = get_listing(include_stats=include_stats)
+
+	key = (directory, include_stats)
+	cached = _listing_body_cache.get(key)
+	if cached is None or cached[0] != signature:
+		body = orjson.dumps(
+			[item.model_dump() for item in items],
+			option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+		)
+		digest = hashlib.blake2b(body, digest_size=8)
+		digest.update(repr(signature).encode())
+		etag = f'"{digest.hexdigest()}"'
+		cached = _listing_body_cache[key] = (signature, body, etag)
+
+	_, body, etag = cached
+	headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+	if request.headers.get('if-none-match') == etag:
+		return Response(status_code=304, headers=headers)
+	return Response(content=body, media_type='application/json', headers=headers)
 
 
 @router.get('/health', response_model=HealthResponse)
 async def health_check(fs: JSSFileService = Depends(get_file_service)):
 	"""Health check endpoint"""
-	from datetime import datetime
-
 	# Get counts for health info
-	instances_count = len(fs.get_instances())
-	controllers_count = len(fs.get_controllers())
-
-	return HealthResponse(
-		status='healthy',
-		version='1.0.0',
-		timestamp=datetime.now().isoformat(),
-		available_instances=instances_count,
-		available_controllers=controllers_count,
+	instances_count = fs.count_instances()
+	controllers_count = fs.count_controllers()
+
+	return _orjson_response(
+		HealthResponse.model_construct(
+			status='healthy',
+			version='1.0.0',
+			timestamp=_iso_second(int(time.time())),
+			available_instances=instances_count,
+			available_controllers=controllers_count,
+		)
 	)
 
 
 @router.get('/instances', response_model=List[InstanceInfo])
 async def get_instances(
+	request: Request,
 	include_stats: bool = Query(False, description='Include detailed statistics'),
 	fs: JSSFileService = Depends(get_file_service),
 ):
 	"""Get list of available JSS instances"""
 	try:
-		return fs.get_instances(include_stats=include_stats)
+		return _cached_listing_response(request, fs.instances_dir, include_stats, fs.get_instances_with_signature)
 	except Exception as e:
 		raise HTTPException(status_code=500, detail=f'Failed to get instances: {str(e)}')
 
 
 @router.get('/controllers', response_model=List[ControllerInfo])
 async def get_controllers(
+	request: Request,
 	include_stats: bool = Query(False, description='Include detailed statistics'),
 	fs: JSSFileService = Depends(get_file_service),
 ):
 	"""Get list of available controllers"""
 	try:
-		return fs.get_controllers(include_stats=include_stats)
+		return _cached_listing_response(request, fs.controllers_dir, include_stats, fs.get_controllers_with_signature)
 	except Exception as e:
 		raise HTTPException(status_code=500, detail=f'Failed to get controllers: {str(e)}')
 
 
-@router.post('/compare', response_model=ComparisonResult)
-async def run_comparison(request: ComparisonRequest, es: JSSExecutionService = Depends(get_execution_service)):
+@router.post('/compare', response_model=ComparisonResult, openapi_extra=_json_body_openapi(ComparisonRequest))
+async def run_comparison(
+	request: ComparisonRequest = Depends(_json_body(ComparisonRequest)),
+	es: JSSExecutionService = Depends(get_execution_service),
+):
 	"""Run comprehensive comparison of JSS methods"""
 	try:
 		result = await es.run_comparison(request)
-		return result
+		return _orjson_response(result)
 	except ValueError as e:
 		raise HTTPException(status_code=400, detail=str(e))
 	except Exception as e:
 		raise HTTPException(status_code=500, detail=f'Comparison failed: {str(e)}')
 
 
-@router.post('/compare/background')
-async def run_comparison_background(request: ComparisonRequest, es: JSSExecutionService = Depends(get_execution_service)):
+@router.post('/compare/background', openapi_extra=_json_body_openapi(ComparisonRequest))
+async def run_comparison_background(
+	request: ComparisonRequest = Depends(_json_body(ComparisonRequest)),
+	es: JSSExecutionService = Depends(get_execution_service),
+):
 	"""Run comprehensive comparison in background"""
 	try:
 		task_id = await es.run_comparison_background(request)
 		return {'task_id': task_id, 'status': 'started'}
+	except TaskStoreFullError as e:
+		raise HTTPException(status_code=503, detail=str(e))
 	except ValueError as e:
 		raise HTTPException(status_code=400, detail=str(e))
 	except Exception as e:
@@ -114,18 +217,18 @@ async def get_task_status(task_id: str, es: JSSExecutionService = Depends(get_ex
 	task = es.get_task_status(task_id)
 	if not task:
 		raise HTTPException(status_code=404, detail=f"Task '{task_id}' not found")
-	return task
+	return ORJSONResponse(task)
 
 
 @router.get('/tasks', response_model=List[BackgroundTaskStatus])
 async def get_all_tasks(es: JSSExecutionService = Depends(get_execution_service)):
 	"""Get all background tasks"""
-	return es.get_all_tasks()
+	return ORJSONResponse(es.get_all_tasks())
 
 
-@router.post('/visualizations')
+@router.post('/visualizations', openapi_extra=_json_body_openapi(VisualizationRequest))
 async def generate_visualizations(
-	request: VisualizationRequest,
+	request: VisualizationRequest = Depends(_json_body(VisualizationRequest)),
 	es: JSSExecutionService = Depends(get_execution_service),
 ):
 	"""Generate visualizations for comparison results"""
@@ -145,69 +248,73 @@ async def list_result_files(
 ):
 	"""List result files"""
 	try:
-		files = es.list_result_files(pattern)
+		files = await asyncio.get_event_loop().run_in_executor(es.io_executor, es.list_result_files, pattern)
 		return {'files': files}
 	except Exception as e:
 		raise HTTPException(status_code=500, detail=f'Failed to list files: {str(e)}')
 
 
 @router.get('/files/download/{file_path:path}')
-async def download_file(file_path: str, es: JSSExecutionService = Depends(get_execution_service)):
+async def download_file(
+	file_path: str = PathParam(..., pattern=_RESULT_PATH_PATTERN, max_length=512),
+	es: JSSExecutionService = Depends(get_execution_service),
+):
 	"""Download a result file"""
 	try:
-		full_path = es.get_file_path(file_path)
-		filename = file_path.split('/')[-1]
-		return FileResponse(path=full_path, filename=filename, media_type='application/octet-stream')
+		# One stat off the event loop; passing it on stops FileResponse from stat-ing again
+		full_path, stat_result = await asyncio.get_event_loop().run_in_executor(es.io_executor, es.stat_result_file, file_path)
+		filename = os.path.basename(file_path)
+		return FileResponse(
+			path=full_path,
+			filename=filename,
+			media_type='application/octet-stream',
+			stat_result=stat_result,
+		)
 	except FileNotFoundError:
 		raise HTTPException(status_code=404, detail=f'File not found: {file_path}')
 	except Exception as e:
 		raise HTTPException(status_code=500, detail=f'Failed to download file: {str(e)}')
 
 
-@router.post('/run', response_model=SingleRunResult)
-async def run_single_episode(request: SingleRunRequest, es: JSSExecutionService = Depends(get_execution_service)):
+@router.post('/run', response_model=SingleRunResult, openapi_extra=_json_body_openapi(SingleRunRequest))
+async def run_single_episode(
+	request: SingleRunRequest = Depends(_json_body(SingleRunRequest)),
+	es: JSSExecutionService = Depends(get_execution_service),
+):
 	"""Run a single JSS episode"""
 	try:
 		result = await es.run_single_episode(request)
-		return result
+		return _orjson_response(result)
 	except ValueError as e:
 		raise HTTPException(status_code=400, detail=str(e))
 	except Exception as e:
 		raise HTTPException(status_code=500, detail=f'Execution failed: {str(e)}')
 
 
-@router.get('/instances/{instance_name}/info')
+@router.get('/instances/{instance_name}/info', response_model=InstanceInfo)
 async def get_instance_info(instance_name: str, fs: JSSFileService = Depends(get_file_service)):
 	"""Get detailed information about a specific instance"""
 	try:
-		if not fs.instance_exists(instance_name):
-			raise HTTPException(status_code=404, detail=f"Instance '{instance_name}' not found")
-
-		instances = fs.get_instances()
-		instance = next((i for i in instances if i.name == instance_name), None)
+		instance = fs.get_instance_info(instance_name)
 		if not instance:
 			raise HTTPException(status_code=404, detail=f"Instance '{instance_name}' not found")
 
-		return instance
+		return _orjson_response(instance)
 	except HTTPException:
 		raise
 	except Exception as e:
 		raise HTTPException(status_code=500, detail=f'Failed to get instance info: {str(e)}')
 
 
-@router.get('/controllers/{controller_name}/info')
+@router.get('/controllers/{controller_name}/info', response_model=ControllerInfo)
 async def get_controller_info(controller_name: str, fs: JSSFileService = Depends(get_file_service)):
 	"""Get detailed information about a specific controller"""
 	try:
-		if not fs.controller_exists(controller_name):
-			raise HTTPException(status_code=404, detail=f"Controller '{controller_name}' not found")
-
-		controllers = fs.get_controllers()
-		controller = next((c for c in controllers if c.name == controller_name), None)
+		controller = fs.get_controller_info(controller_name)
 		if not controller:
 			raise HTTPException(status_code=404, detail=f"Controller '{controller_name}' not found")
 
-		return controller
+		return _orjson_response(controller)
 	except HTTPException:
 		raise
 	except Exception as e:
@@ -215,8 +322,14 @@ async def get_controller_info(controller_name: str, fs: JSSFileService = Depends
 
 
 # Initialize services (to be called from main app)
-def init_services(instances_dir: str, controllers_dir: str, results_dir: str = None):
-	"""Initialize services with directory paths"""
-	global file_service, execution_service
-	file_service = JSSFileService(instances_dir, controllers_dir, results_dir)
-	execution_service = JSSExecutionService(file_service)
+def init_services(app: FastAPI, instances_dir: str, controllers_dir: str, results_dir: str = None):
+	"""Initialize services with directory paths and attach them to app.state"""
+	app.state.file_service = JSSFileService(instances_dir, controllers_dir, results_dir)
+	app.state.execution_service = JSSExecutionService(app.state.file_service)
+
+
+def shutdown_services(app: FastAPI):
+	"""Stop the execution service's worker pools"""
+	execution_service = getattr(app.state, 'execution_service', None)
+	if execution_service is not None:
+		execution_service.shutdown()
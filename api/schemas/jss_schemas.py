@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -25,6 +25,12 @@ class DispatchingRule(str, Enum):
 	CR = 'CR'
 
 
+# Request fields use Literal mirrors of the enums above: pydantic validates these in its core
+# with a direct value lookup, and str values still compare equal to the (str) enum members
+AgentTypeLiteral = Literal['hybrid', 'lookahead', 'controller']
+DispatchingRuleLiteral = Literal['SPT', 'FIFO', 'MWR', 'LWR', 'MOR', 'LOR', 'CR']
+
+
 class InstanceStats(BaseModel):
 	"""Statistics about an instance"""
 
@@ -74,8 +80,8 @@ class ComparisonRequest(BaseModel):
 
 	instance_name: str = Field(..., description='Name of the JSS instance')
 	controller_name: Optional[str] = Field(None, description='Controller name (optional)')
-	agents: List[AgentType] = Field(default=[AgentType.HYBRID], description='Agents to compare')
-	dispatching_rules: List[DispatchingRule] = Field(default=[], description='Dispatching rules to compare')
+	agents: List[AgentTypeLiteral] = Field(default=['hybrid'], description='Agents to compare')
+	dispatching_rules: List[DispatchingRuleLiteral] = Field(default=[], description='Dispatching rules to compare')
 	num_episodes: int = Field(default=10, ge=1, le=100, description='Number of episodes to run')
 	include_random_baseline: bool = Field(default=True, description='Include random baseline')
 	include_visualizations: bool = Field(default=True, description='Generate visualizations')
@@ -86,7 +92,7 @@ class SingleRunRequest(BaseModel):
 
 	instance_name: str = Field(..., description='Name of the JSS instance')
 	controller_name: Optional[str] = Field(None, description='Controller name (optional)')
-	agent_type: AgentType = Field(default=AgentType.HYBRID, description='Agent type to use')
+	agent_type: AgentTypeLiteral = Field(default='hybrid', description='Agent type to use')
 	num_people: Optional[int] = Field(None, description='Number of people (for controller agent)')
 
 
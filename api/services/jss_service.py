@@ -3,28 +3,34 @@ JSS Service - Business logic layer
 """
 
 import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import re
+import stat
+import threading
 import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
 
 # Import from project modules
 import sys
-import gym
 import numpy as np
-import pandas as pd
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from api.schemas.jss_schemas import (
 	AgentType,
-	BackgroundTaskStatus,
 	ComparisonRequest,
 	ComparisonResult,
 	ControllerInfo,
 	ControllerStats,
+	DispatchingRule,
 	InstanceInfo,
 	InstanceStats,
 	PerformanceMetrics,
@@ -32,14 +38,51 @@ from api.schemas.jss_schemas import (
 	SingleRunResult,
 	VisualizationRequest,
 )
-from comparison_framework.agents import (
-	AdaptiveLookAheadAgent,
-	BaseJSSAgent,
-	HybridPriorityScoringAgent,
+
+# The agents, environment, comparison framework and visualizer (gymnasium, pandas, matplotlib)
+# are imported where they are used: they only run in worker processes, so the API process
+# and endpoints such as /instances never pay for them
+if TYPE_CHECKING:
+	from comparison_framework.agents import BaseJSSAgent
+
+# PerformanceMetrics float fields, in column order of the comparison metric table
+_FLOAT_METRIC_FIELDS = (
+	'avg_makespan',
+	'std_makespan',
+	'min_makespan',
+	'max_makespan',
+	'avg_reward',
+	'std_reward',
+	'avg_execution_time',
 )
-from comparison_framework.advanced_visualizer import AdvancedJSSVisualizer
-from comparison_framework.comparison_framework import JSSComparisonFramework
-from controller_agent import ControllerJSSAgent
+
+# Dispatching rules every comparison evaluates, in the framework's order
+_DISPATCHING_RULES = tuple(rule.value for rule in DispatchingRule)
+
+# Lazy %-style args: nothing is formatted unless the record is actually emitted
+logger = logging.getLogger('jss.api')
+
+# A line of a controller file with at least one token, i.e. one person
+_NON_BLANK_LINE = re.compile(rb'^[ \t\r\f\v]*\S', re.MULTILINE)
+
+# Upper bound on background tasks kept in memory; finished tasks are evicted oldest first, and new
+# tasks are refused while every slot holds a pending or running one
+_MAX_BACKGROUND_TASKS = 256
+# Finished tasks not updated for this long are dropped even while there is room
+_FINISHED_TASK_TTL_SECONDS = 3600
+
+
+class TaskStoreFullError(RuntimeError):
+	"""Raised when every background task slot holds a task that is still pending or running"""
+
+
+def _warmup_worker(_: int = 0):
+	"""No-op job that makes a spawned worker import the agents, framework and visualizer ahead of real work"""
+	from comparison_framework.agents import HybridPriorityScoringAgent
+	from comparison_framework.comparison_framework import JSSComparisonFramework  # noqa: F401
+	from controller_agent import ControllerJSSAgent  # noqa: F401
+
+	HybridPriorityScoringAgent()
 
 
 class JSSFileService:
@@ -49,33 +92,187 @@ class JSSFileService:
 		self.instances_dir = Path(instances_dir)
 		self.controllers_dir = Path(controllers_dir)
 		self.results_dir = Path(results_dir) if results_dir else Path('results')
+		# String forms for per-request path building, so lookups skip PurePath construction
+		self._instances_str = os.fspath(self.instances_dir)
+		self._controllers_str = os.fspath(self.controllers_dir)
 
 		# Ensure directories exist
 		self.instances_dir.mkdir(exist_ok=True)
 		self.controllers_dir.mkdir(exist_ok=True)
 		self.results_dir.mkdir(exist_ok=True)
 
+		# Parsed listings keyed on (directory, include_stats) -> (signature, sorted list, by-name dict).
+		# The signature is the (name, mtime_ns, size) of every listed file, so adding, removing or
+		# rewriting any file (including one still being uploaded) invalidates the entry.
+		self._listing_cache: Dict[Tuple[Path, bool], Tuple[tuple, list, dict]] = {}
+		# File counts keyed on directory -> (dir mtime_ns, count), for health checks; a count only
+		# depends on which files exist, and creating, removing or renaming one bumps the directory mtime
+		self._count_cache: Dict[Path, Tuple[int, int]] = {}
+		# Per-file parse results keyed on (directory, include_stats) -> {file name: ((mtime_ns, size), info)},
+		# so a rescan after one file changes only re-parses that file
+		self._parse_cache: Dict[Tuple[Path, bool], Dict[str, Tuple[Tuple[int, int], Any]]] = {}
+
+	def _cached_count(self, directory: Path, suffix: str = '') -> int:
+		"""Count regular files in a directory (optionally by suffix) without parsing them"""
+		try:
+			mtime = directory.stat().st_mtime_ns
+		except FileNotFoundError:
+			return 0
+
+		cached = self._count_cache.get(directory)
+		if cached is not None and cached[0] == mtime:
+			return cached[1]
+
+		# DirEntry.is_file uses the d_type from the directory read, so no stat per entry
+		with os.scandir(directory) as it:
+			count = sum(1 for entry in it if self._is_listed(entry, suffix))
+		self._count_cache[directory] = (mtime, count)
+		return count
+
+	def count_instances(self) -> int:
+		"""Number of available instances"""
+		return self._cached_count(self.instances_dir)
+
+	def count_controllers(self) -> int:
+		"""Number of available controllers"""
+		return self._cached_count(self.controllers_dir, '.txt')
+
+	def _cached_listing(self, directory: Path, include_stats: bool, parse: Callable, suffix: str = '') -> Tuple[list, dict, tuple]:
+		"""Return (sorted items, items by name, signature) for a directory, re-parsing only if a listed file changed"""
+		try:
+			with os.scandir(directory) as it:
+				entries = sorted((entry for entry in it if self._is_listed(entry, suffix)), key=lambda entry: entry.name)
+		except FileNotFoundError:
+			return [], {}, ()
+		file_stats = [entry.stat() for entry in entries]
+		signature = tuple((entry.name, file_stat.st_mtime_ns, file_stat.st_size) for entry, file_stat in zip(entries, file_stats))
+
+		key = (directory, include_stats)
+		cached = self._listing_cache.get(key)
+		if cached is not None and cached[0] == signature:
+			return cached[1], cached[2], signature
+
+		items = self._parse_entries(directory, include_stats, parse, entries, file_stats)
+		by_name = {item.name: item for item in items}
+		self._listing_cache[key] = (signature, items, by_name)
+		return items, by_name, signature
+
+	@staticmethod
+	def _is_listed(entry: os.DirEntry, suffix: str) -> bool:
+		"""Whether a directory entry is a listable data file; hidden/metadata files are skipped"""
+		# Check the name first so non-matching entries never need a type lookup
+		name = entry.name
+		return not name.startswith('.') and name.endswith(suffix) and entry.is_file()
+
+	def _parse_entries(self, directory: Path, include_stats: bool, parse: Callable, entries: List[os.DirEntry], file_stats: List[os.stat_result]) -> list:
+		"""Parse the listed files of a directory, reusing results for files whose mtime and size are unchanged"""
+		previous = self._parse_cache.get((directory, include_stats), {})
+		current = {}
+		items = []
+		for entry, file_stat in zip(entries, file_stats):
+			signature = (file_stat.st_mtime_ns, file_stat.st_size)
+			cached = previous.get(entry.name)
+			info = cached[1] if cached is not None and cached[0] == signature else parse(Path(entry.path), include_stats, file_stat)
+			current[entry.name] = (signature, info)
+			items.append(info)
+
+		# Replacing the map drops entries for files that are gone
+		self._parse_cache[(directory, include_stats)] = current
+		return items
+
+	def _instance_listing(self, include_stats: bool) -> Tuple[List[InstanceInfo], Dict[str, InstanceInfo], tuple]:
+		return self._cached_listing(self.instances_dir, include_stats, self._parse_instance_file)
+
+	def _controller_listing(self, include_stats: bool) -> Tuple[List[ControllerInfo], Dict[str, ControllerInfo], tuple]:
+		return self._cached_listing(self.controllers_dir, include_stats, self._parse_controller_file, '.txt')
+
 	def get_instances(self, include_stats: bool = False) -> List[InstanceInfo]:
 		"""Get list of available instances with optional detailed stats"""
-		instances = []
-		if self.instances_dir.exists():
-			for file_path in self.instances_dir.iterdir():
-				if file_path.is_file():
-					instance_info = self._parse_instance_file(file_path, include_stats)
-					instances.append(instance_info)
-		return sorted(instances, key=lambda x: x.name)
+		return list(self._instance_listing(include_stats)[0])
 
 	def get_controllers(self, include_stats: bool = False) -> List[ControllerInfo]:
 		"""Get list of available controllers with optional detailed stats"""
-		controllers = []
-		if self.controllers_dir.exists():
-			for file_path in self.controllers_dir.iterdir():
-				if file_path.is_file() and file_path.suffix == '.txt':
-					controller_info = self._parse_controller_file(file_path, include_stats)
-					controllers.append(controller_info)
-		return sorted(controllers, key=lambda x: x.name)
-
-	def _parse_instance_file(self, file_path: Path, include_stats: bool = False) -> InstanceInfo:
+		return list(self._controller_listing(include_stats)[0])
+
+	def get_instances_with_signature(self, include_stats: bool = False) -> Tuple[List[InstanceInfo], tuple]:
+		"""Instances plus the (name, mtime_ns, size) signature of the files they were parsed from"""
+		instances, _, signature = self._instance_listing(include_stats)
+		return list(instances), signature
+
+	def get_controllers_with_signature(self, include_stats: bool = False) -> Tuple[List[ControllerInfo], tuple]:
+		"""Controllers plus the (name, mtime_ns, size) signature of the files they were parsed from"""
+		controllers, _, signature = self._controller_listing(include_stats)
+		return list(controllers), signature
+
+	def get_instance_info(self, instance_name: str, include_stats: bool = False) -> Optional[InstanceInfo]:
+		"""Look up a single instance by name"""
+		return self._instance_listing(include_stats)[1].get(instance_name)
+
+	def get_controller_info(self, controller_name: str, include_stats: bool = False) -> Optional[ControllerInfo]:
+		"""Look up a single controller by name"""
+		return self._controller_listing(include_stats)[1].get(controller_name)
+
+	def get_controller_by_name(self, controller_name: str, include_stats: bool = False) -> Optional[ControllerInfo]:
+		"""Parse just one controller file (no directory scan), reusing the per-file parse cache"""
+		file_name = f'{controller_name}.txt'
+		if os.path.basename(file_name) != file_name:
+			return None
+		file_path = self.controllers_dir / file_name
+		try:
+			file_stat = file_path.stat()
+		except FileNotFoundError:
+			return None
+		if not stat.S_ISREG(file_stat.st_mode):
+			return None
+
+		signature = (file_stat.st_mtime_ns, file_stat.st_size)
+		parsed = self._parse_cache.setdefault((self.controllers_dir, include_stats), {})
+		cached = parsed.get(file_name)
+		if cached is not None and cached[0] == signature:
+			return cached[1]
+
+		info = self._parse_controller_file(file_path, include_stats, file_stat)
+		parsed[file_name] = (signature, info)
+		return info
+
+	@staticmethod
+	def _parse_instance_header(header: bytes) -> Optional[Tuple[int, int]]:
+		"""Parse the 'num_jobs num_machines' header line of an instance"""
+		parts = header.split()
+		if len(parts) >= 2:
+			return int(parts[0]), int(parts[1])
+		return None
+
+	@staticmethod
+	def _compute_instance_stats(name: str, job_lines: List[bytes], num_jobs: int, num_machines: int) -> InstanceStats:
+		"""Compute detailed statistics from the instance's job lines, which are (machine, time) pairs"""
+		flat = np.fromstring(b' '.join(job_lines), dtype=np.int64, sep=' ')
+		if flat.size == 2 * num_jobs * num_machines:
+			# Well-formed instance: every other token in the whole block is a time
+			processing_times = flat[1::2]
+		else:
+			# Ragged or malformed lines: pair up per line (raises on non-integer tokens)
+			processing_times = np.concatenate([np.array(line.split(), dtype=np.int64)[1::2] for line in job_lines] or [flat[:0]])
+
+		total_operations = int(processing_times.size)
+		avg_processing_time = float(processing_times.mean()) if total_operations else 0.0
+		complexity_score = (num_jobs * num_machines * total_operations) / 1000.0  # Normalized complexity
+
+		return InstanceStats.model_construct(
+			name=name,
+			num_jobs=num_jobs,
+			num_machines=num_machines,
+			total_operations=total_operations,
+			avg_processing_time=avg_processing_time,
+			complexity_score=complexity_score,
+		)
+
+	def _parse_instance_file(
+		self,
+		file_path: Path,
+		include_stats: bool = False,
+		file_stat: Optional[os.stat_result] = None,
+	) -> InstanceInfo:
 		"""Parse instance file and extract information"""
 		# Basic info
 		size = 'Unknown'
@@ -84,51 +281,25 @@ class JSSFileService:
 		file_size = None
 
 		try:
-			file_stat = file_path.stat()
+			if file_stat is None:
+				file_stat = file_path.stat()
 			created_at = datetime.fromtimestamp(file_stat.st_ctime, tz=timezone.utc)
 			file_size = file_stat.st_size
 
-			with open(file_path, 'r') as f:
-				lines = f.readlines()
-				if lines:
-					first_line = lines[0].strip()
-					parts = first_line.split()
-					if len(parts) >= 2:
-						num_jobs = int(parts[0])
-						num_machines = int(parts[1])
-						size = f'{num_jobs}x{num_machines}'
-
-						if include_stats:
-							# Calculate detailed stats
-							total_operations = 0
-							processing_times = []
-
-							# Parse job lines
-							for i in range(1, min(num_jobs + 1, len(lines))):
-								job_line = lines[i].strip().split()
-								operations = len(job_line) // 2
-								total_operations += operations
-
-								# Extract processing times
-								for j in range(1, len(job_line), 2):
-									if j < len(job_line):
-										processing_times.append(int(job_line[j]))
-
-							avg_processing_time = sum(processing_times) / len(processing_times) if processing_times else 0
-							complexity_score = (num_jobs * num_machines * total_operations) / 1000.0  # Normalized complexity
-
-							stats = InstanceStats(
-								name=file_path.name,
-								num_jobs=num_jobs,
-								num_machines=num_machines,
-								total_operations=total_operations,
-								avg_processing_time=avg_processing_time,
-								complexity_score=complexity_score,
-							)
+			# Stream the file: listings only need the header, stats only the num_jobs lines after it
+			with open(file_path, 'rb') as f:
+				dims = self._parse_instance_header(f.readline())
+				if dims and include_stats:
+					job_lines = list(itertools.islice(f, dims[0]))
+
+			if dims:
+				size = f'{dims[0]}x{dims[1]}'
+				if include_stats:
+					stats = self._compute_instance_stats(file_path.name, job_lines, *dims)
 		except Exception as e:
-			print(f'Warning: Could not parse instance file {file_path}: {e}')
+			logger.warning('Could not parse instance file %s: %s', file_path, e)
 
-		return InstanceInfo(
+		return InstanceInfo.model_construct(
 			name=file_path.name,
 			path=str(file_path),
 			size=size,
@@ -137,7 +308,12 @@ class JSSFileService:
 			file_size=file_size,
 		)
 
-	def _parse_controller_file(self, file_path: Path, include_stats: bool = False) -> ControllerInfo:
+	def _parse_controller_file(
+		self,
+		file_path: Path,
+		include_stats: bool = False,
+		file_stat: Optional[os.stat_result] = None,
+	) -> ControllerInfo:
 		"""Parse controller file and extract information"""
 		num_people = 0
 		num_machines = 0
@@ -146,41 +322,39 @@ class JSSFileService:
 		file_size = None
 
 		try:
-			file_stat = file_path.stat()
+			if file_stat is None:
+				file_stat = file_path.stat()
 			created_at = datetime.fromtimestamp(file_stat.st_ctime, tz=timezone.utc)
 			file_size = file_stat.st_size
 
-			with open(file_path, 'r') as f:
-				lines = f.readlines()
-				num_people = len([line for line in lines if line.strip()])
-
-				machines = set()
-				qualifications_per_person = []
-
-				for line in lines:
-					if line.strip():
-						person_machines = list(map(int, line.strip().split()))
-						machines.update(person_machines)
-						qualifications_per_person.append(len(person_machines))
-
-				num_machines = len(machines)
-
-				if include_stats and qualifications_per_person:
-					avg_qualifications = sum(qualifications_per_person) / len(qualifications_per_person)
-					max_possible_machines = max(machines) if machines else 1
-					coverage_percentage = (num_machines / max_possible_machines) * 100 if max_possible_machines > 0 else 0
-
-					stats = ControllerStats(
-						name=file_path.stem,
-						num_people=num_people,
-						num_machines=num_machines,
-						avg_qualifications_per_person=avg_qualifications,
-						coverage_percentage=coverage_percentage,
-					)
+			# Bytes: no decode or newline translation
+			data = file_path.read_bytes()
+
+			# Every non-blank line is a person and lists the machines they can run; both the
+			# people count and the token split are single C-level passes over the buffer
+			num_people = len(_NON_BLANK_LINE.findall(data))
+			tokens = data.split()
+
+			# Convert all machine ids in one strict vectorised call instead of boxing each as a Python int
+			machines = np.unique(np.array(tokens, dtype=np.bytes_).astype(np.int64))
+			num_machines = int(machines.size)
+
+			if include_stats and num_people:
+				avg_qualifications = len(tokens) / num_people
+				max_possible_machines = int(machines[-1]) if num_machines else 1
+				coverage_percentage = (num_machines / max_possible_machines) * 100 if max_possible_machines > 0 else 0.0
+
+				stats = ControllerStats.model_construct(
+					name=file_path.stem,
+					num_people=num_people,
+					num_machines=num_machines,
+					avg_qualifications_per_person=avg_qualifications,
+					coverage_percentage=coverage_percentage,
+				)
 		except Exception as e:
-			print(f'Warning: Could not parse controller file {file_path}: {e}')
+			logger.warning('Could not parse controller file %s: %s', file_path, e)
 
-		return ControllerInfo(
+		return ControllerInfo.model_construct(
 			name=file_path.stem,
 			path=str(file_path),
 			num_people=num_people,
@@ -192,19 +366,26 @@ class JSSFileService:
 
 	def get_instance_path(self, instance_name: str) -> str:
 		"""Get full path for instance"""
-		return str(self.instances_dir / instance_name)
+		return os.path.join(self._instances_str, instance_name)
 
 	def get_controller_path(self, controller_name: str) -> str:
 		"""Get full path for controller"""
-		return str(self.controllers_dir / f'{controller_name}.txt')
+		return os.path.join(self._controllers_str, f'{controller_name}.txt')
 
-	def instance_exists(self, instance_name: str) -> bool:
-		"""Check if instance exists"""
-		return (self.instances_dir / instance_name).exists()
+	def resolve_instance(self, instance_name: str) -> Tuple[str, os.stat_result]:
+		"""Get path and stat for an instance with a single stat call; raises ValueError if it is missing"""
+		instance_path = self.get_instance_path(instance_name)
+		try:
+			return instance_path, os.stat(instance_path)
+		except (FileNotFoundError, NotADirectoryError):
+			raise ValueError(f"Instance '{instance_name}' not found")
 
-	def controller_exists(self, controller_name: str) -> bool:
-		"""Check if controller exists"""
-		return (self.controllers_dir / f'{controller_name}.txt').exists()
+	def resolve_controller(self, controller_name: str) -> ControllerInfo:
+		"""Get parsed info for a controller (one stat, cached parse); raises ValueError if it is missing"""
+		controller_info = self.get_controller_by_name(controller_name)
+		if controller_info is None:
+			raise ValueError(f"Controller '{controller_name}' not found")
+		return controller_info
 
 
 class JSSExecutionService:
@@ -212,29 +393,111 @@ class JSSExecutionService:
 
 	def __init__(self, file_service: JSSFileService):
 		self.file_service = file_service
-		self.executor = ThreadPoolExecutor(max_workers=4)
-		self.background_tasks: Dict[str, BackgroundTaskStatus] = {}
+		# Threads for blocking file I/O, kept apart from the CPU-bound work below so a
+		# long comparison never queues file requests behind it; they mostly wait on syscalls,
+		# so there can be several per core
+		self.io_executor = ThreadPoolExecutor(
+			max_workers=min(32, (os.cpu_count() or 4) * 4),
+			thread_name_prefix='jss-io',
+		)
+		# CPU-bound episodes run in separate processes so they don't hold the GIL the event loop
+		# needs for status polling; 'spawn' avoids forking a process that already runs threads
+		cpu_workers = max(1, (os.cpu_count() or 2) - 1)
+		self.cpu_executor = ProcessPoolExecutor(
+			max_workers=cpu_workers,
+			mp_context=multiprocessing.get_context('spawn'),
+		)
+		# Chart renders get their own small pool so they never queue behind comparison jobs
+		render_workers = 2
+		self.render_pool = ProcessPoolExecutor(
+			max_workers=render_workers,
+			mp_context=multiprocessing.get_context('spawn'),
+		)
+		# Start every worker now so the first request doesn't pay the cold imports
+		for pool, workers in ((self.cpu_executor, cpu_workers), (self.render_pool, render_workers)):
+			for i in range(workers):
+				pool.submit(_warmup_worker, i)
+		# Tasks are kept as plain dicts with the BackgroundTaskStatus fields, keyed by task ID,
+		# so status routes can hand them straight to the JSON encoder. Timestamps are stored as
+		# time.time() floats and only turned into datetimes on read. The store is kept in
+		# least-recently-used order, capped at _MAX_BACKGROUND_TASKS entries, and finished tasks
+		# expire after _FINISHED_TASK_TTL_SECONDS
+		self.background_tasks: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+		self._tasks_lock = threading.Lock()
+		# The event loop only keeps weak references to tasks, so running background jobs are
+		# held here until they finish
+		self._running_jobs: Set[asyncio.Task] = set()
 		# Do not instantiate AdvancedJSSVisualizer here; instantiate with results when needed
 
+	def shutdown(self):
+		"""Stop all executors without waiting; queued jobs are cancelled instead of run at exit"""
+		for executor in (self.cpu_executor, self.render_pool, self.io_executor):
+			executor.shutdown(wait=False, cancel_futures=True)
+
 	# Background Task Management
 	def create_background_task(self, task_type: str) -> str:
 		"""Create a new background task and return its ID"""
 		task_id = str(uuid.uuid4())
-		self.background_tasks[task_id] = BackgroundTaskStatus(
-			task_id=task_id,
-			status='pending',
-			created_at=datetime.now(timezone.utc),
-			updated_at=datetime.now(timezone.utc),
-		)
+		now = time.time()
+		with self._tasks_lock:
+			self._evict_finished_tasks()
+			# Only finished tasks can be evicted, so a store full of active ones stays full
+			if len(self.background_tasks) >= _MAX_BACKGROUND_TASKS:
+				raise TaskStoreFullError(f'Too many active background tasks (limit {_MAX_BACKGROUND_TASKS}); try again later')
+			self.background_tasks[task_id] = {
+				'task_id': task_id,
+				'status': 'pending',
+				'progress': None,
+				'result': None,
+				'error': None,
+				'created_at': now,
+				'updated_at': now,
+			}
 		return task_id
 
-	def get_task_status(self, task_id: str) -> Optional[BackgroundTaskStatus]:
+	@staticmethod
+	def _is_expired(task: Dict[str, Any], cutoff: float) -> bool:
+		"""Whether a task is finished and was last updated before cutoff (epoch seconds)"""
+		return task['status'] not in ('pending', 'running') and task['updated_at'] < cutoff
+
+	def _evict_finished_tasks(self):
+		"""Drop expired finished tasks, then least recently used ones until there is room for one more (lock held)"""
+		cutoff = time.time() - _FINISHED_TASK_TTL_SECONDS
+		for task_id in [task_id for task_id, task in self.background_tasks.items() if self._is_expired(task, cutoff)]:
+			del self.background_tasks[task_id]
+
+		excess = len(self.background_tasks) - _MAX_BACKGROUND_TASKS + 1
+		if excess <= 0:
+			return
+		finished = [task_id for task_id, task in self.background_tasks.items() if task['status'] not in ('pending', 'running')]
+		for task_id in finished[:excess]:
+			del self.background_tasks[task_id]
+
+	def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
 		"""Get status of a background task"""
-		return self.background_tasks.get(task_id)
-
-	def get_all_tasks(self) -> List[BackgroundTaskStatus]:
+		with self._tasks_lock:
+			task = self.background_tasks.get(task_id)
+			if task is None:
+				return None
+			if self._is_expired(task, time.time() - _FINISHED_TASK_TTL_SECONDS):
+				del self.background_tasks[task_id]
+				return None
+			self.background_tasks.move_to_end(task_id)
+			return self._task_view(task)
+
+	def get_all_tasks(self) -> List[Dict[str, Any]]:
 		"""Get all background tasks"""
-		return list(self.background_tasks.values())
+		cutoff = time.time() - _FINISHED_TASK_TTL_SECONDS
+		with self._tasks_lock:
+			return [self._task_view(task) for task in self.background_tasks.values() if not self._is_expired(task, cutoff)]
+
+	@staticmethod
+	def _task_view(task: Dict[str, Any]) -> Dict[str, Any]:
+		"""Copy of a task with its epoch timestamps turned into UTC datetimes"""
+		view = dict(task)
+		view['created_at'] = datetime.fromtimestamp(task['created_at'], tz=timezone.utc)
+		view['updated_at'] = datetime.fromtimestamp(task['updated_at'], tz=timezone.utc)
+		return view
 
 	def update_task_status(
 		self,
@@ -245,26 +508,63 @@ class JSSExecutionService:
 		error: str = None,
 	):
 		"""Update background task status"""
-		if task_id in self.background_tasks:
-			task = self.background_tasks[task_id]
-			task.status = status
-			task.updated_at = datetime.now(timezone.utc)
+		with self._tasks_lock:
+			task = self.background_tasks.get(task_id)
+			if task is None:
+				return
+			self.background_tasks.move_to_end(task_id)
+			task['status'] = status
+			task['updated_at'] = time.time()
 			if progress is not None:
-				task.progress = progress
+				task['progress'] = progress
 			if result is not None:
-				task.result = result
+				task['result'] = result
 			if error is not None:
-				task.error = error
+				task['error'] = error
+
+	def _resolve_comparison_inputs(self, request: ComparisonRequest) -> Tuple[str, Optional[str], Optional[int]]:
+		"""Validate a comparison request and return (instance_path, controller_path, num_people)"""
+		instance_path, _ = self.file_service.resolve_instance(request.instance_name)
+
+		controller_path = None
+		num_people = None
+		if request.controller_name:
+			controller_info = self.file_service.resolve_controller(request.controller_name)
+			controller_path = self.file_service.get_controller_path(request.controller_name)
+			num_people = controller_info.num_people
+
+		# The controller agent can't run without a controller that lists at least one person
+		if AgentType.CONTROLLER in request.agents:
+			if controller_path is None:
+				raise ValueError('Controller agent requires a controller_name')
+			if not num_people:
+				raise ValueError(f"Controller '{request.controller_name}' is empty or could not be parsed")
+
+		return instance_path, controller_path, num_people
 
 	# Synchronous execution methods
+	async def run_comparison(self, request: ComparisonRequest) -> ComparisonResult:
+		"""Run comparison and wait for the result"""
+		instance_path, controller_path, num_people = self._resolve_comparison_inputs(request)
+
+		result, method_stats = await self._run_comparison_parallel(request, instance_path, controller_path, num_people)
+
+		if request.include_visualizations:
+			await self._generate_visualizations_for_result(result, method_stats)
+
+		return result
 
 	# Background execution methods
 	async def run_comparison_background(self, request: ComparisonRequest) -> str:
 		"""Run comparison in background and return task ID"""
+		# Reject invalid inputs up front rather than as a failed task
+		self._resolve_comparison_inputs(request)
 		task_id = self.create_background_task('comparison')
 
 		# Start background task
-		asyncio.create_task(self._run_comparison_background_task(task_id, request))
+		job = asyncio.create_task(self._run_comparison_background_task(task_id, request))
+		self._running_jobs.add(job)
+		job.add_done_callback(self._running_jobs.discard)
 
 		return task_id
 
@@ -274,35 +574,26 @@ class JSSExecutionService:
 			self.update_task_status(task_id, 'running', 0.0)
 
 			# Validate inputs
-			instance_path = self.file_service.get_instance_path(request.instance_name)
-			if not self.file_service.instance_exists(request.instance_name):
-				raise ValueError(f"Instance '{request.instance_name}' not found")
-
-			controller_path = None
-			if request.controller_name:
-				if not self.file_service.controller_exists(request.controller_name):
-					raise ValueError(f"Controller '{request.controller_name}' not found")
-				controller_path = self.file_service.get_controller_path(request.controller_name)
+			instance_path, controller_path, num_people = self._resolve_comparison_inputs(request)
 
 			self.update_task_status(task_id, 'running', 20.0)
 
-			# Run comparison
-			loop = asyncio.get_event_loop()
-			result = await loop.run_in_executor(
-				self.executor,
-				self._run_comparison_sync,
+			# Progress moves from 20% to 80% as the methods finish
+			result, method_stats = await self._run_comparison_parallel(
 				request,
 				instance_path,
 				controller_path,
+				num_people,
+				on_method_done=lambda done, total: self.update_task_status(task_id, 'running', 20.0 + 60.0 * done / total),
 			)
 
 			self.update_task_status(task_id, 'running', 80.0)
 
 			# Generate visualizations if requested
 			if request.include_visualizations:
-				await self._generate_visualizations_for_result(result, task_id)
+				await self._generate_visualizations_for_result(result, method_stats, task_id)
 
-			self.update_task_status(task_id, 'completed', 100.0, result.dict())
+			self.update_task_status(task_id, 'completed', 100.0, result.model_dump())
 
 		except Exception as e:
 			self.update_task_status(task_id, 'failed', error=str(e))
@@ -314,7 +605,7 @@ class JSSExecutionService:
 		visualization_paths = {}
 
 		# Create results directory for this request
-		timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+		timestamp = time.strftime('%Y%m%d_%H%M%S')
 		results_subdir = results_dir / f'{request.instance_name}_{timestamp}'
 		results_subdir.mkdir(exist_ok=True)
 
@@ -342,30 +633,58 @@ class JSSExecutionService:
 
 		return visualization_paths
 
-	async def _generate_visualizations_for_result(self, result: ComparisonResult, task_id: str):
-		"""Generate visualizations for a comparison result"""
+	async def _generate_visualizations_for_result(
+		self,
+		result: ComparisonResult,
+		method_stats: Dict[str, Dict[str, Any]],
+		task_id: Optional[str] = None,
+	):
+		"""Generate visualizations for a comparison result from its per-method summary stats"""
+		# Create results directory for this task
+		timestamp = time.strftime('%Y%m%d_%H%M%S')
+		results_subdir = self.file_service.results_dir / f'{result.instance_name}_{timestamp}'
 		try:
-			# Create results directory for this task
-			timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-			results_subdir = self.file_service.results_dir / f'{result.instance_name}_{timestamp}'
 			results_subdir.mkdir(exist_ok=True)
 
-			# Convert ComparisonResult to dict for AdvancedJSSVisualizer
-			visualizer_results = {}
-			for method_name, metrics in result.results.items():
-				# If metrics is a pydantic model, convert to dict
-				if hasattr(metrics, 'dict'):
-					metrics = metrics.dict()
-				visualizer_results[method_name] = metrics
-
-			visualizer = AdvancedJSSVisualizer(visualizer_results, result.instance_name)
+			# Both charts render concurrently; worker processes rather than threads because
+			# rendering holds the GIL and applies its fonts through matplotlib's global rcParams
 			dashboard_path = results_subdir / 'comprehensive_dashboard.png'
-			visualizer.create_comprehensive_dashboard(str(dashboard_path))
 			detailed_path = results_subdir / 'detailed_comparison.png'
-			visualizer.create_detailed_comparison(str(detailed_path))
-			print(f'📊 Visualizations generated in {results_subdir}')
+			loop = asyncio.get_event_loop()
+			await asyncio.gather(
+				loop.run_in_executor(
+					self.render_pool,
+					self._render_chart,
+					method_stats,
+					result.instance_name,
+					'create_comprehensive_dashboard',
+					str(dashboard_path),
+				),
+				loop.run_in_executor(
+					self.render_pool,
+					self._render_chart,
+					method_stats,
+					result.instance_name,
+					'create_detailed_comparison',
+					str(detailed_path),
+				),
+			)
+			logger.info('📊 Visualizations generated in %s', results_subdir)
 		except Exception as e:
-			print(f'Warning: Failed to generate visualizations for task {task_id}: {e}')
+			logger.warning('Failed to generate visualizations for task %s: %s', task_id, e)
+			# Don't leave an empty results directory behind when nothing was rendered
+			try:
+				results_subdir.rmdir()
+			except OSError:
+				pass
+
+	@staticmethod
+	def _render_chart(results: Dict, instance_name: str, chart: str, save_path: str):
+		"""Render one AdvancedJSSVisualizer chart (by method name) to save_path"""
+		from comparison_framework.advanced_visualizer import AdvancedJSSVisualizer
+
+		visualizer = AdvancedJSSVisualizer(results, instance_name)
+		getattr(visualizer, chart)(save_path)
 
 	async def _generate_dashboard(
 		self,
@@ -375,11 +694,13 @@ class JSSExecutionService:
 	):
 		"""Generate comprehensive dashboard"""
 		if results_data:
+			from comparison_framework.advanced_visualizer import AdvancedJSSVisualizer
+
 			visualizer = AdvancedJSSVisualizer(results_data, request.instance_name)
 			visualizer.create_comprehensive_dashboard(str(output_path))
 		else:
 			# Create placeholder when no results data available
-			print(f'Warning: No results data available for dashboard generation')
+			logger.warning('No results data available for dashboard generation')
 
 	async def _generate_detailed_comparison(
 		self,
@@ -389,10 +710,12 @@ class JSSExecutionService:
 	):
 		"""Generate detailed comparison chart"""
 		if results_data:
+			from comparison_framework.advanced_visualizer import AdvancedJSSVisualizer
+
 			visualizer = AdvancedJSSVisualizer(results_data, request.instance_name)
 			visualizer.create_detailed_comparison(str(output_path))
 		else:
-			print(f'Warning: No results data available for detailed comparison generation')
+			logger.warning('No results data available for detailed comparison generation')
 
 	async def _generate_gantt_charts(
 		self,
@@ -405,46 +728,71 @@ class JSSExecutionService:
 		if results_data:
 			# Generate Gantt charts would require additional schedule data
 			# This is a placeholder for now - would need to be implemented with actual schedule data
-			print(f'Gantt chart generation not yet implemented')
+			logger.info('Gantt chart generation not yet implemented')
 		return {}
 
 	# File management methods
 	def list_result_files(self, pattern: str = None) -> List[Dict[str, Any]]:
 		"""List result files in the results directory"""
-		files = []
-		results_dir = self.file_service.results_dir
-
-		if results_dir.exists():
-			for item in results_dir.rglob('*'):
-				if item.is_file():
-					if pattern is None or pattern in item.name:
-						file_info = {
-							'name': item.name,
-							'path': str(item.relative_to(results_dir)),
-							'full_path': str(item),
-							'size': item.stat().st_size,
-							'modified': datetime.fromtimestamp(item.stat().st_mtime).isoformat(),
-							'type': item.suffix.lower().lstrip('.'),
-						}
-						files.append(file_info)
-
-		return sorted(files, key=lambda x: x['modified'], reverse=True)
+		results_dir = str(self.file_service.results_dir)
+		entries = []
+
+		# Walk with scandir so each file costs one stat; symlinked directories
+		# are not descended into, same as Path.rglob
+		pending = [results_dir]
+		while pending:
+			try:
+				it = os.scandir(pending.pop())
+			except (FileNotFoundError, NotADirectoryError):
+				continue
+			with it:
+				for entry in it:
+					if entry.is_dir(follow_symlinks=False):
+						pending.append(entry.path)
+					elif entry.is_file() and (pattern is None or pattern in entry.name):
+						entries.append((entry.stat(), entry))
+
+		# Sort on the raw mtime and only format the rows that are returned
+		entries.sort(key=lambda item: item[0].st_mtime_ns, reverse=True)
+		return [
+			{
+				'name': entry.name,
+				'path': os.path.relpath(entry.path, results_dir),
+				'full_path': entry.path,
+				'size': st.st_size,
+				'modified': datetime.fromtimestamp(st.st_mtime).isoformat(),
+				'type': os.path.splitext(entry.name)[1].lower().lstrip('.'),
+			}
+			for st, entry in entries
+		]
 
 	def get_file_path(self, relative_path: str) -> str:
 		"""Get full path for a result file"""
-		full_path = self.file_service.results_dir / relative_path
-		if full_path.exists() and full_path.is_file():
-			return str(full_path)
-		raise FileNotFoundError(f'File not found: {relative_path}')
+		return self.stat_result_file(relative_path)[0]
 
+	def stat_result_file(self, relative_path: str) -> Tuple[str, os.stat_result]:
+		"""Get full path and stat for a result file, with a single stat call"""
+		full_path = self.file_service.results_dir / relative_path
+		try:
+			stat_result = os.stat(full_path)
+		except (FileNotFoundError, NotADirectoryError):
+			stat_result = None
+		if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+			raise FileNotFoundError(f'File not found: {relative_path}')
+		return str(full_path), stat_result
+
+	@staticmethod
 	def _create_agent(
-		self,
-		agent_type: AgentType,
+		agent_type: str,
 		instance_path: str = None,
 		controller_path: str = None,
 		num_people: int = None,
-	) -> BaseJSSAgent:
+	) -> 'BaseJSSAgent':
 		"""Create agent instance based on type"""
+		# Importing the agents module also registers the jss-v1 environment the controller agent needs
+		from comparison_framework.agents import AdaptiveLookAheadAgent, HybridPriorityScoringAgent
+		from controller_agent import ControllerJSSAgent
+
 		if agent_type == AgentType.HYBRID:
 			return HybridPriorityScoringAgent()
 		elif agent_type == AgentType.LOOKAHEAD:
@@ -456,107 +804,167 @@ class JSSExecutionService:
 		else:
 			raise ValueError(f'Unknown agent type: {agent_type}')
 
-	def _run_comparison_sync(
-		self,
+	@staticmethod
+	def _comparison_methods(
 		request: ComparisonRequest,
 		instance_path: str,
 		controller_path: Optional[str],
-	) -> ComparisonResult:
-		"""Synchronous comparison execution"""
-		start_time = time.time()
-
-		# Initialize framework
-		framework = JSSComparisonFramework(instance_path)
-
-		# Create custom agents
-		custom_agents = []
+		num_people: Optional[int],
+	) -> List[Tuple[str, str, tuple]]:
+		"""(kind, name, agent args) for every method a comparison evaluates, in result order"""
+		methods = []
 		for agent_type in request.agents:
-			if agent_type == AgentType.CONTROLLER and controller_path:
-				# Get controller info for num_people
-				controller_info = next(
-					(c for c in self.file_service.get_controllers() if c.name == request.controller_name),
-					None,
-				)
-				if controller_info:
-					agent = self._create_agent(
-						agent_type,
-						instance_path,
-						controller_path,
-						controller_info.num_people,
-					)
-					custom_agents.append(agent)
+			if agent_type == AgentType.CONTROLLER:
+				# controller_path and num_people are resolved and checked by _resolve_comparison_inputs
+				methods.append(('agent', agent_type, (instance_path, controller_path, num_people)))
 			else:
-				agent = self._create_agent(agent_type)
-				custom_agents.append(agent)
+				methods.append(('agent', agent_type, ()))
+		methods.extend(('rule', rule, ()) for rule in _DISPATCHING_RULES)
+		methods.append(('random', 'Random', ()))
+		return methods
+
+	@staticmethod
+	def _evaluate_method(
+		kind: str,
+		name: str,
+		agent_args: tuple,
+		instance_path: str,
+		num_episodes: int,
+	) -> Optional[Tuple[str, Dict[str, Any]]]:
+		"""Run all episodes of one comparison method (static so it can be pickled into a worker process)"""
+		from comparison_framework.comparison_framework import JSSComparisonFramework
+
+		framework = JSSComparisonFramework(instance_path)
+		if kind == 'agent':
+			agent = JSSExecutionService._create_agent(name, *agent_args)
+			return agent.get_name(), framework.run_agent_evaluation(agent, num_episodes)
+		if kind == 'rule':
+			# A failing dispatching rule is left out of the comparison, as in run_comprehensive_comparison
+			try:
+				return name, framework.run_dispatching_rule_evaluation(name, num_episodes)
+			except Exception as e:
+				logger.warning('Error running %s: %s', name, e)
+				return None
+		return name, framework.run_random_baseline(num_episodes)
+
+	async def _run_comparison_parallel(
+		self,
+		request: ComparisonRequest,
+		instance_path: str,
+		controller_path: Optional[str],
+		num_people: Optional[int] = None,
+		on_method_done: Optional[Callable[[int, int], None]] = None,
+	) -> Tuple[ComparisonResult, Dict[str, Dict[str, Any]]]:
+		"""Evaluate each method as its own job in the process pool; returns the ranked result and the raw per-method stats"""
+		start_time = time.time()
+		methods = self._comparison_methods(request, instance_path, controller_path, num_people)
 
-		# Run comparison
-		results_df = framework.run_comprehensive_comparison(custom_agents=custom_agents, num_episodes=request.num_episodes)
+		loop = asyncio.get_event_loop()
+		futures = [
+			loop.run_in_executor(
+				self.cpu_executor,
+				self._evaluate_method,
+				kind,
+				name,
+				agent_args,
+				instance_path,
+				request.num_episodes,
+			)
+			for kind, name, agent_args in methods
+		]
+		reporting = on_method_done is not None
+		if reporting:
+			finished = 0
+
+			def _count_finished(_):
+				nonlocal finished
+				finished += 1
+				# Completions that land after a failure must not overwrite the caller's status
+				if reporting:
+					on_method_done(finished, len(futures))
+
+			for future in futures:
+				future.add_done_callback(_count_finished)
 
-		# Convert results to response format
+		try:
+			evaluations = await asyncio.gather(*futures)
+		except BaseException:
+			# Don't leave the rest of this comparison queued ahead of other requests
+			reporting = False
+			for future in futures:
+				future.cancel()
+			raise
+
+		# Same insertion order (and overwrite on duplicate names) as the sequential framework run
+		results = {}
+		for evaluation in evaluations:
+			if evaluation is not None:
+				results[evaluation[0]] = evaluation[1]
+
+		custom_agents = sum(1 for kind, _, _ in methods if kind == 'agent')
+		return self._summarize_comparison(request, results, custom_agents, time.time() - start_time), results
+
+	@staticmethod
+	def _summarize_comparison(
+		request: ComparisonRequest,
+		results: Dict[str, Dict[str, Any]],
+		custom_agents: int,
+		execution_time: float,
+	) -> ComparisonResult:
+		"""Rank per-method summary stats into a ComparisonResult"""
+		# Gather metrics column-wise (one row per method) so ranking is a single argsort
+		methods = list(results)
+		metric_table = np.array(
+			[[metrics[field] for field in _FLOAT_METRIC_FIELDS] for metrics in results.values()],
+			dtype=np.float64,
+		).reshape(len(methods), len(_FLOAT_METRIC_FIELDS))
+		order = np.argsort(metric_table[:, 0], kind='stable')  # column 0 is avg_makespan
+
+		# Convert results to response format (values are server-computed, so skip validation;
+		# tolist() turns each row into builtin floats in one call)
 		results_dict = {}
-		for method, metrics in framework.results.items():
-			results_dict[method] = PerformanceMetrics(
-				avg_makespan=metrics['avg_makespan'],
-				std_makespan=metrics['std_makespan'],
-				min_makespan=metrics['min_makespan'],
-				max_makespan=metrics['max_makespan'],
-				avg_reward=metrics['avg_reward'],
-				std_reward=metrics['std_reward'],
-				avg_execution_time=metrics['avg_execution_time'],
-				total_episodes=metrics['total_episodes'],
+		for method, row, metrics in zip(methods, metric_table.tolist(), results.values()):
+			results_dict[method] = PerformanceMetrics.model_construct(
+				**dict(zip(_FLOAT_METRIC_FIELDS, row)),
+				total_episodes=int(metrics['total_episodes']),
 			)
 
 		# Get best method
-		best_method = results_df.iloc[0]['Method']
-		best_makespan = results_df.iloc[0]['Avg_Makespan']
-		ranking = results_df['Method'].tolist()
-
-		execution_time = time.time() - start_time
+		ranking = [methods[i] for i in order]
+		best_method = ranking[0]
+		best_makespan = metric_table[order[0], 0]
 
-		return ComparisonResult(
+		return ComparisonResult.model_construct(
 			instance_name=request.instance_name,
 			controller_name=request.controller_name,
 			results=results_dict,
 			best_method=best_method,
-			best_makespan=best_makespan,
+			best_makespan=float(best_makespan),
 			ranking=ranking,
 			execution_summary={
 				'total_execution_time': execution_time,
 				'episodes_per_method': request.num_episodes,
 				'methods_compared': len(results_dict),
-				'custom_agents': len(custom_agents),
+				'custom_agents': custom_agents,
 				'dispatching_rules': len(request.dispatching_rules),
 			},
 		)
 
 	async def run_single_episode(self, request: SingleRunRequest) -> SingleRunResult:
 		"""Run a single episode with specified agent"""
-		instance_path = self.file_service.get_instance_path(request.instance_name)
-
-		if not self.file_service.instance_exists(request.instance_name):
-			raise ValueError(f"Instance '{request.instance_name}' not found")
+		instance_path, _ = self.file_service.resolve_instance(request.instance_name)
 
 		controller_path = None
 		num_people = None
 		if request.controller_name:
-			if not self.file_service.controller_exists(request.controller_name):
-				raise ValueError(f"Controller '{request.controller_name}' not found")
+			controller_info = self.file_service.resolve_controller(request.controller_name)
 			controller_path = self.file_service.get_controller_path(request.controller_name)
+			num_people = controller_info.num_people or request.num_people
 
-			# Get controller info
-			controller_info = next(
-				(c for c in self.file_service.get_controllers() if c.name == request.controller_name),
-				None,
-			)
-			if controller_info:
-				num_people = controller_info.num_people
-			elif request.num_people:
-				num_people = request.num_people
-
-		# Run single episode in thread pool
+		# Run single episode in the process pool
 		loop = asyncio.get_event_loop()
 		result = await loop.run_in_executor(
-			self.executor,
+			self.cpu_executor,
 			self._run_single_episode_sync,
 			request,
 			instance_path,
@@ -566,14 +974,45 @@ class JSSExecutionService:
 
 		return result
 
+	@staticmethod
+	def _schedule_records(schedule: List[tuple], with_person: bool) -> List[Dict[str, Any]]:
+		"""Schedule tuples as response dicts, converted column-wise so NumPy integers become builtin ints"""
+		if not schedule:
+			return []
+
+		def builtin(column: tuple) -> list:
+			# One tolist() per column instead of a NumPy scalar per field, which is far cheaper
+			# to pickle back from the worker process; non-integer columns are kept as they are
+			values = np.asarray(column)
+			return values.tolist() if values.dtype.kind in 'iub' else list(column)
+
+		columns = list(zip(*schedule))
+		job_ids, machine_ids, start_times, end_times = (builtin(column) for column in columns[:4])
+		person_ids = builtin(columns[4]) if with_person and len(columns) > 4 else [None] * len(job_ids)
+
+		return [
+			{
+				'job_id': job_id,
+				'machine_id': machine_id,
+				'start_time': start_time,
+				'end_time': end_time,
+				'person_id': person_id,
+			}
+			for job_id, machine_id, start_time, end_time, person_id in zip(job_ids, machine_ids, start_times, end_times, person_ids)
+		]
+
+	@staticmethod
 	def _run_single_episode_sync(
-		self,
 		request: SingleRunRequest,
 		instance_path: str,
 		controller_path: Optional[str],
 		num_people: Optional[int],
 	) -> SingleRunResult:
-		"""Synchronous single episode execution"""
+		"""Synchronous single episode execution (static so it can be pickled into a worker process)"""
+		# The framework import also registers the jss-v1 environment the controller agent needs
+		from comparison_framework.comparison_framework import JSSComparisonFramework
+		from controller_agent import ControllerJSSAgent
+
 		start_time = time.time()
 
 		# Create agent
@@ -584,115 +1023,26 @@ class JSSExecutionService:
 			makespan, total_reward, schedule = agent.run_episode()
 
 			# Convert schedule format
-			schedule_tasks = []
-			for task in schedule:
-				schedule_tasks.append({
-					'job_id': task[0],
-					'machine_id': task[1],
-					'start_time': task[2],
-					'end_time': task[3],
-					'person_id': task[4] if len(task) > 4 else None,
-				})
+			schedule_tasks = JSSExecutionService._schedule_records(schedule, with_person=True)
 		else:
 			# Use comparison framework for other agents
 			framework = JSSComparisonFramework(instance_path)
-			agent = self._create_agent(request.agent_type)
+			agent = JSSExecutionService._create_agent(request.agent_type)
 
 			# Run single episode with schedule capture
 			makespan, total_reward, execution_time, schedule = framework.env_manager.run_episode_with_schedule_capture(lambda env, obs: agent(env, obs))
 
 			# Convert schedule format
-			schedule_tasks = []
-			for task in schedule:
-				schedule_tasks.append({
-					'job_id': task[0],
-					'machine_id': task[1],
-					'start_time': task[2],
-					'end_time': task[3],
-					'person_id': None,
-				})
+			schedule_tasks = JSSExecutionService._schedule_records(schedule, with_person=False)
 
 		execution_time = time.time() - start_time
 
-		return SingleRunResult(
+		return SingleRunResult.model_construct(
 			instance_name=request.instance_name,
 			controller_name=request.controller_name,
-			agent_type=request.agent_type.value,
-			makespan=makespan,
-			total_reward=total_reward,
+			agent_type=request.agent_type,
+			makespan=float(makespan),
+			total_reward=float(total_reward),
 			execution_time=execution_time,
 			schedule=schedule_tasks,
 		)
-
-	def _run_comparison_sync(
-		self,
-		request: ComparisonRequest,
-		instance_path: str,
-		controller_path: Optional[str],
-	) -> ComparisonResult:
-		"""Synchronous comparison execution"""
-		start_time = time.time()
-
-		# Initialize framework
-		framework = JSSComparisonFramework(instance_path)
-
-		# Create custom agents
-		custom_agents = []
-		for agent_type in request.agents:
-			if agent_type == AgentType.CONTROLLER and controller_path:
-				# Get controller info for num_people
-				controller_info = next(
-					(c for c in self.file_service.get_controllers() if c.name == request.controller_name),
-					None,
-				)
-				if controller_info:
-					agent = self._create_agent(
-						agent_type,
-						instance_path,
-						controller_path,
-						controller_info.num_people,
-					)
-					custom_agents.append(agent)
-			else:
-				agent = self._create_agent(agent_type)
-				custom_agents.append(agent)
-
-		# Run comparison
-		results_df = framework.run_comprehensive_comparison(custom_agents=custom_agents, num_episodes=request.num_episodes)
-
-		# Convert results to response format
-		results_dict = {}
-		for method, metrics in framework.results.items():
-			results_dict[method] = PerformanceMetrics(
-				avg_makespan=metrics['avg_makespan'],
-				std_makespan=metrics['std_makespan'],
-				min_makespan=metrics['min_makespan'],
-				max_makespan=metrics['max_makespan'],
-				avg_reward=metrics['avg_reward'],
-				std_reward=metrics['std_reward'],
-				avg_execution_time=metrics['avg_execution_time'],
-				total_episodes=metrics['total_episodes'],
-			)
-
-		# Get best method
-		best_method = results_df.iloc[0]['Method']
-		best_makespan = results_df.iloc[0]['Avg_Makespan']
-		ranking = results_df['Method'].tolist()
-
-		execution_time = time.time() - start_time
-
-		return ComparisonResult(
-			instance_name=request.instance_name,
-			controller_name=request.controller_name,
-			results=results_dict,
-			best_method=best_method,
-			best_makespan=best_makespan,
-			ranking=ranking,
-			execution_summary={
-				'total_execution_time': execution_time,
-				'episodes_per_method': request.num_episodes,
-				'methods_compared': len(results_dict),
-				'custom_agents': len(custom_agents),
-				'dispatching_rules': len(request.dispatching_rules),
-			},
-		)
@@ -2,17 +2,45 @@
 FastAPI application for Job Shop Scheduling (JSS) API
 """
 
+import functools
+import weakref
 from pathlib import Path
 from fastapi import FastAPI
+import fastapi.dependencies.utils as fastapi_dependency_utils
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 import uvicorn
 
 # Import routes
-from api.routes.jss_routes import router as jss_router, init_services
+from api.routes.jss_routes import router as jss_router, init_services, shutdown_services
 from api.routes.file_routes import router as file_router
 
+
+def _memoize_callable_check(check):
+	"""Cache an inspect-based predicate per callable; results never change for a given function"""
+	cache = weakref.WeakKeyDictionary()
+
+	@functools.wraps(check)
+	def cached(call):
+		try:
+			return cache[call]
+		except KeyError:
+			pass
+		except TypeError:
+			# Not weak-referenceable; fall back to the uncached check
+			return check(call)
+		result = cache[call] = check(call)
+		return result
+
+	return cached
+
+
+# FastAPI re-runs these inspect checks for every dependency on every request
+for _name in ('is_coroutine_callable', 'is_gen_callable', 'is_async_gen_callable'):
+	if hasattr(fastapi_dependency_utils, _name):
+		setattr(fastapi_dependency_utils, _name, _memoize_callable_check(getattr(fastapi_dependency_utils, _name)))
+
 # Get project root directory
 PROJECT_ROOT = Path(__file__).parent
 INSTANCES_DIR = PROJECT_ROOT / 'instances'
@@ -26,6 +54,7 @@ app = FastAPI(
 	version='1.0.0',
 	docs_url='/docs',
 	redoc_url='/redoc',
+	default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -55,7 +84,7 @@ async def startup_event():
 	RESULTS_DIR.mkdir(exist_ok=True)
 
 	# Initialize services with results directory
-	init_services(str(INSTANCES_DIR), str(CONTROLLERS_DIR), str(RESULTS_DIR))
+	init_services(app, str(INSTANCES_DIR), str(CONTROLLERS_DIR), str(RESULTS_DIR))
 
 	print('🚀 JSS API started!')
 	print(f'📁 Instances directory: {INSTANCES_DIR}')
@@ -63,6 +92,13 @@ async def startup_event():
 	print(f'📊 Results directory: {RESULTS_DIR}')
 
 
+@app.on_event('shutdown')
+async def shutdown_event():
+	"""Release worker pools on shutdown"""
+	# Queued comparison jobs are cancelled so a reload or SIGTERM doesn't wait for them
+	shutdown_services(app)
+
+
 @app.get('/', response_class=HTMLResponse)
 async def root():
 	"""Root endpoint with API information"""
@@ -2,13 +2,24 @@ import warnings
 from pathlib import Path
 from typing import Dict, List
 
+import matplotlib
+
+# Rendering is file-only; select Agg before pyplot is imported so no GUI toolkit loads
+matplotlib.use('Agg')
+
 import matplotlib.font_manager as fm
 import matplotlib.patches as mpatches
 import matplotlib.pyplot as plt
+from matplotlib import cycler
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.figure import Figure
 import numpy as np
 import pandas as pd
 import seaborn as sns
 from matplotlib.gridspec import GridSpec
+from matplotlib.lines import Line2D
 
 warnings.filterwarnings('ignore', category=FutureWarning)
 warnings.filterwarnings('ignore', category=UserWarning)
@@ -17,23 +28,30 @@ warnings.filterwarnings('ignore', category=UserWarning)
 class AdvancedJSSVisualizer:
 	"""Advanced visualization class for JSS comparison results"""
 
+	# Priority list of fonts (Windows compatible)
+	_PREFERRED_FONTS = [
+		'Segoe UI',  # Windows 10/11 default
+		'Calibri',  # Office suite font
+		'Arial',  # Classic Windows font
+		'Tahoma',  # Windows system font
+		'Verdana',  # Web-safe font
+		'DejaVu Sans',  # Cross-platform font
+		'sans-serif',  # Generic fallback
+	]
+	# Plot styles to try in order (seaborn style names changed in matplotlib 3.6)
+	_PREFERRED_STYLES = ['seaborn-v0_8-whitegrid', 'seaborn-whitegrid']
+	# Resolved font and style rcParams, shared by all instances once _configure_style has run
+	_FONT = None
+	_STYLE_RC = None
+	# Column labels of the statistics heatmap
+	_HEATMAP_COLUMNS = ['Avg Makespan', 'Std Makespan', 'Min Makespan', 'Max Makespan', 'Avg Time (ms)']
+
 	def __init__(self, results: Dict, instance_name: str = 'JSS Instance'):
-		self.results = results
+		self.results = self._ingest(results)
 		self.instance_name = instance_name
 
-		# Set style with proper seaborn version handling
-		try:
-			plt.style.use('seaborn-v0_8-whitegrid')
-		except Exception:
-			try:
-				plt.style.use('seaborn-whitegrid')
-			except Exception:
-				plt.style.use('default')
-
-		sns.set_palette('husl')
-
-		# Set fonts that are available on Windows
-		self._configure_fonts()
+		# Resolve the plot style and a font available on Windows
+		self._configure_style()
 
 		# Define color scheme
 		self.colors = {
@@ -49,113 +67,187 @@ class AdvancedJSSVisualizer:
 			'Random': '#A9A9A9',  # Dark Gray
 		}
 
-	def _configure_fonts(self):
-		"""Configure matplotlib fonts for Windows compatibility"""
-		# Get list of available fonts
-		available_fonts = [f.name for f in fm.fontManager.ttflist]
-
-		# Priority list of fonts (Windows compatible)
-		preferred_fonts = [
-			'Segoe UI',  # Windows 10/11 default
-			'Calibri',  # Office suite font
-			'Arial',  # Classic Windows font
-			'Tahoma',  # Windows system font
-			'Verdana',  # Web-safe font
-			'DejaVu Sans',  # Cross-platform font
-			'sans-serif',  # Generic fallback
-		]
+		# Cache per-method arrays shared by the dashboard panels
+		self._precompute_arrays()
+
+	@classmethod
+	def _configure_style(cls):
+		"""Resolve the plot style and font to use once per process (Windows compatible first)"""
+		if cls._FONT is not None:
+			return
+
+		# First available seaborn whitegrid style, else matplotlib's defaults, with the husl palette
+		style_rc = next((dict(plt.style.library[style]) for style in cls._PREFERRED_STYLES if style in plt.style.library), {})
+		style_rc['axes.prop_cycle'] = cycler(color=sns.color_palette('husl'))
+		cls._STYLE_RC = style_rc
+
+		# Set of available fonts for O(1) membership checks
+		available_fonts = {f.name for f in fm.fontManager.ttflist}
 
 		# Find the first available font
 		selected_font = 'sans-serif'  # Default fallback
-		for font in preferred_fonts:
+		for font in cls._PREFERRED_FONTS:
 			if font in available_fonts or font == 'sans-serif':
 				selected_font = font
 				break
 
-		# Configure matplotlib
-		plt.rcParams['font.family'] = selected_font
-		plt.rcParams['font.sans-serif'] = preferred_fonts
-		plt.rcParams['axes.unicode_minus'] = False
+		cls._FONT = selected_font
 
 		# Suppress font warnings
 		import logging
 
 		logging.getLogger('matplotlib.font_manager').setLevel(logging.ERROR)
 
-	def create_comprehensive_dashboard(self, save_path: str = None, figsize=(22, 26)):
-		"""Create a comprehensive dashboard with multiple visualizations"""
-
-		# Create figure with custom layout
-		fig = plt.figure(figsize=figsize, facecolor='white')
-		gs = GridSpec(
-			4,
-			3,
-			height_ratios=[1.2, 1, 1, 0.4],
-			width_ratios=[1.2, 1, 1],
-			hspace=0.35,
-			wspace=0.3,
-		)
-
-		# Main title
-		fig.suptitle(
-			f'Job Shop Scheduling Performance Analysis\n{self.instance_name}',
-			fontsize=22,
-			fontweight='bold',
-			y=0.96,
-		)
-
-		# 1. Performance Overview (Top row, spanning 2 columns)
-		ax1 = fig.add_subplot(gs[0, :2])
-		self._create_performance_overview(ax1)
-
-		# 2. Performance Ranking (Top right)
-		ax2 = fig.add_subplot(gs[0, 2])
-		self._create_ranking_plot(ax2)
-
-		# 3. Makespan Distribution (Second row, left)
-		ax3 = fig.add_subplot(gs[1, 0])
-		self._create_violin_plot(ax3)
-
-		# 4. Performance vs Consistency (Second row, center)
-		ax4 = fig.add_subplot(gs[1, 1])
-		self._create_scatter_plot(ax4)
+	def _style_rc(self) -> Dict:
+		"""Style and font rcParams applied via rc_context while rendering, instead of mutating globals"""
+		return {
+			**self._STYLE_RC,
+			'font.family': self._FONT,
+			'font.sans-serif': self._PREFERRED_FONTS,
+			'axes.unicode_minus': False,
+		}
 
-		# 5. Improvement Analysis (Second row, right)
-		ax5 = fig.add_subplot(gs[1, 2])
-		self._create_improvement_analysis(ax5)
+	@staticmethod
+	def _new_figure(**kwargs) -> Figure:
+		"""Figure bound to an Agg canvas, kept out of pyplot's global figure registry"""
+		fig = Figure(**kwargs)
+		FigureCanvasAgg(fig)
+		return fig
 
-		# 6. Detailed Statistics Heatmap (Third row, spanning all)
-		ax6 = fig.add_subplot(gs[2, :])
-		self._create_statistics_heatmap(ax6)
+	@staticmethod
+	def _png_save_kwargs(save_path: str) -> Dict:
+		"""Fast PNG encoder settings; plots are mostly flat colour so level 1 costs little size"""
+		if Path(save_path).suffix.lower() in ('', '.png'):
+			return {'pil_kwargs': {'compress_level': 1, 'optimize': False}}
+		return {}
+
+	@staticmethod
+	def _ingest(results: Dict) -> Dict:
+		"""Per-method copies with all_makespans as a float64 array, converted once instead of per panel"""
+		return {method: {**stats, 'all_makespans': np.ascontiguousarray(stats['all_makespans'], dtype=np.float64)} for method, stats in results.items()}
+
+	def _precompute_arrays(self):
+		"""Build method/makespan arrays and the ranking order once for all panels"""
+		self._methods = np.array(list(self.results), dtype=str)
+		count = len(self._methods)
+		self._avg = np.fromiter((self.results[m]['avg_makespan'] for m in self._methods), dtype=np.float64, count=count)
+		self._std = np.fromiter((self.results[m]['std_makespan'] for m in self._methods), dtype=np.float64, count=count)
+		# Stable sort keeps ties in insertion order, matching sorted()
+		self._order = np.argsort(self._avg, kind='stable')
+		# RGBA rows aligned with self._methods, parsed from hex once
+		self._color_rgba = to_rgba_array([self.colors.get(m, '#696969') for m in self._methods])
+		# Custom agents are highlighted; traditional rules exclude them and the random baseline
+		self._is_custom = np.fromiter((m.startswith(('Hybrid', 'Adaptive')) for m in self._methods), dtype=bool, count=count)
+		self._is_traditional = ~self._is_custom & (self._methods != 'Random')
+		self._episode_cache = None
+
+	def _top_k(self, k: int) -> np.ndarray:
+		"""Indices of the k best (lowest avg makespan) methods, best first, without a full sort"""
+		if len(self._avg) <= k:
+			return np.argsort(self._avg, kind='stable')
+		threshold = np.partition(self._avg, k - 1)[k - 1]
+		# Everything tied with the k-th value is a candidate so ties resolve like a stable sort
+		candidates = np.flatnonzero(self._avg <= threshold)
+		return candidates[np.argsort(self._avg[candidates], kind='stable')][:k]
+
+	def _prepare_episode_data(self):
+		"""
+		Walk every method's all_makespans once and memoize the shared views
+
+		Returns:
+		    Tuple of (methods, per-method makespan arrays, (methods, episodes) matrix
+		    or None when episode counts differ, long-form Method/Makespan DataFrame)
+		"""
+		if self._episode_cache is None:
+			methods = self._methods
+			makespans = [self.results[m]['all_makespans'] for m in methods]
+			lengths = np.fromiter((a.size for a in makespans), dtype=np.intp, count=len(makespans))
+
+			matrix = None
+			if makespans and (lengths == lengths[0]).all():
+				matrix = np.vstack(makespans)
+				# Rows of the matrix replace the separate arrays so panels share one buffer
+				makespans = list(matrix)
+				flat = matrix.ravel()
+			else:
+				flat = np.concatenate(makespans) if makespans else np.empty(0)
 
-		# 7. Performance Summary Table (Bottom)
-		ax7 = fig.add_subplot(gs[3, :])
-		self._create_summary_table(ax7)
+			long_df = pd.DataFrame({'Method': np.repeat(methods, lengths), 'Makespan': flat})
+			self._episode_cache = (methods, makespans, matrix, long_df)
+		return self._episode_cache
 
-		# Adjust layout manually to avoid tight_layout issues
-		plt.subplots_adjust(top=0.93, bottom=0.05, left=0.08, right=0.95)
+	def create_comprehensive_dashboard(self, save_path: str = None, figsize=(22, 26)):
+		"""Create a comprehensive dashboard with multiple visualizations"""
+		with plt.rc_context(self._style_rc()):
+			# Create figure with custom layout
+			fig = self._new_figure(figsize=figsize, facecolor='white')
+			gs = GridSpec(
+				4,
+				3,
+				height_ratios=[1.2, 1, 1, 0.4],
+				width_ratios=[1.2, 1, 1],
+				hspace=0.35,
+				wspace=0.3,
+			)
 
-		if save_path:
-			plt.savefig(
-				save_path,
-				dpi=300,
-				bbox_inches='tight',
-				facecolor='white',
-				edgecolor='none',
+			# Main title
+			fig.suptitle(
+				f'Job Shop Scheduling Performance Analysis\n{self.instance_name}',
+				fontsize=22,
+				fontweight='bold',
+				y=0.96,
 			)
-			print(f'📈Comprehensive dashboard saved to {save_path}')
+
+			# 1. Performance Overview (Top row, spanning 2 columns)
+			ax1 = fig.add_subplot(gs[0, :2])
+			self._create_performance_overview(ax1)
+
+			# 2. Performance Ranking (Top right)
+			ax2 = fig.add_subplot(gs[0, 2])
+			self._create_ranking_plot(ax2)
+
+			# 3. Makespan Distribution (Second row, left)
+			ax3 = fig.add_subplot(gs[1, 0])
+			self._create_violin_plot(ax3)
+
+			# 4. Performance vs Consistency (Second row, center)
+			ax4 = fig.add_subplot(gs[1, 1])
+			self._create_scatter_plot(ax4)
+
+			# 5. Improvement Analysis (Second row, right)
+			ax5 = fig.add_subplot(gs[1, 2])
+			self._create_improvement_analysis(ax5)
+
+			# 6. Detailed Statistics Heatmap (Third row, spanning all)
+			ax6 = fig.add_subplot(gs[2, :])
+			self._create_statistics_heatmap(ax6)
+
+			# 7. Performance Summary Table (Bottom)
+			ax7 = fig.add_subplot(gs[3, :])
+			self._create_summary_table(ax7)
+
+			# Adjust layout manually to avoid tight_layout issues
+			fig.subplots_adjust(top=0.93, bottom=0.05, left=0.08, right=0.95)
+
+			if save_path:
+				fig.savefig(
+					save_path,
+					dpi=300,
+					bbox_inches='tight',
+					facecolor='white',
+					edgecolor='none',
+					**self._png_save_kwargs(save_path),
+				)
+				print(f'📈Comprehensive dashboard saved to {save_path}')
 
 		return fig
 
 	def _create_performance_overview(self, ax):
 		"""Create main performance comparison bar chart"""
-		methods = list(self.results.keys())
-		avg_makespans = [self.results[method]['avg_makespan'] for method in methods]
-		std_makespans = [self.results[method]['std_makespan'] for method in methods]
-
-		# Sort by performance
-		sorted_data = sorted(zip(methods, avg_makespans, std_makespans), key=lambda x: x[1])
-		methods, avg_makespans, std_makespans = zip(*sorted_data)
+		# Sorted by performance
+		methods = self._methods[self._order]
+		avg_makespans = self._avg[self._order]
+		std_makespans = self._std[self._order]
 
 		# Create bars
 		bars = ax.bar(
@@ -164,7 +256,7 @@ class AdvancedJSSVisualizer:
 			yerr=std_makespans,
 			capsize=5,
 			alpha=0.8,
-			color=[self.colors.get(m, '#696969') for m in methods],
+			color=self._color_rgba[self._order],
 			edgecolor='black',
 			linewidth=0.5,
 		)
@@ -181,37 +273,24 @@ class AdvancedJSSVisualizer:
 		ax.set_xticks(range(len(methods)))
 		ax.set_xticklabels(methods, rotation=45, ha='right')
 
-		# Add value labels on bars
-		for i, (bar, val, std) in enumerate(zip(bars, avg_makespans, std_makespans)):
-			height = bar.get_height()
-			ax.text(
-				bar.get_x() + bar.get_width() / 2.0,
-				height + std + max(avg_makespans) * 0.02,
-				f'{val:.0f}',
-				ha='center',
-				va='bottom',
-				fontweight='bold',
-				fontsize=9,
-			)
+		# Add value labels on bars (placed above the error bars)
+		ax.bar_label(bars, labels=[f'{val:.0f}' for val in avg_makespans], padding=3, fontweight='bold', fontsize=9)
 
 		ax.grid(True, alpha=0.3)
 
 	def _create_ranking_plot(self, ax):
 		"""Create ranking visualization"""
-		methods = list(self.results.keys())
-		avg_makespans = [self.results[method]['avg_makespan'] for method in methods]
-
 		# Sort and rank
-		sorted_methods = sorted(zip(methods, avg_makespans), key=lambda x: x[1])
+		method_names = self._methods[self._order]
+		sorted_makespans = self._avg[self._order]
 
-		ranks = list(range(1, len(sorted_methods) + 1))
-		method_names = [m[0] for m in sorted_methods]
+		ranks = list(range(1, len(method_names) + 1))
 
 		# Create horizontal bar chart
 		bars = ax.barh(
 			ranks,
-			[m[1] for m in sorted_methods],
-			color=[self.colors.get(m, '#696969') for m in method_names],
+			sorted_makespans,
+			color=self._color_rgba[self._order],
 			alpha=0.8,
 			edgecolor='black',
 			linewidth=0.5,
@@ -230,30 +309,11 @@ class AdvancedJSSVisualizer:
 		ax.invert_yaxis()
 
 		# Add performance values
-		for i, (bar, (method, makespan)) in enumerate(zip(bars, sorted_methods)):
-			width = bar.get_width()
-			ax.text(
-				width + max([m[1] for m in sorted_methods]) * 0.01,
-				bar.get_y() + bar.get_height() / 2,
-				f'{makespan:.0f}',
-				ha='left',
-				va='center',
-				fontweight='bold',
-				fontsize=9,
-			)
+		ax.bar_label(bars, labels=[f'{makespan:.0f}' for makespan in sorted_makespans], padding=3, fontweight='bold', fontsize=9)
 
 	def _create_violin_plot(self, ax):
 		"""Create violin plot for makespan distribution"""
-		# Prepare data for violin plot
-		makespan_data = []
-		labels = []
-
-		for method in self.results.keys():
-			makespans = self.results[method]['all_makespans']
-			makespan_data.extend(makespans)
-			labels.extend([method] * len(makespans))
-
-		df = pd.DataFrame({'Method': labels, 'Makespan': makespan_data})
+		_, _, _, df = self._prepare_episode_data()
 
 		# Create violin plot with seaborn version compatibility
 		try:
@@ -264,7 +324,7 @@ class AdvancedJSSVisualizer:
 				y='Makespan',
 				ax=ax,
 				hue='Method',
-				palette=[self.colors.get(m, '#696969') for m in df['Method'].unique()],
+				palette=list(self._color_rgba),
 				legend=False,
 			)
 		except Exception:
@@ -275,7 +335,7 @@ class AdvancedJSSVisualizer:
 					x='Method',
 					y='Makespan',
 					ax=ax,
-					palette=[self.colors.get(m, '#696969') for m in df['Method'].unique()],
+					palette=list(self._color_rgba),
 				)
 			except Exception:
 				# Ultimate fallback - simple violin plot
@@ -289,20 +349,17 @@ class AdvancedJSSVisualizer:
 
 	def _create_scatter_plot(self, ax):
 		"""Create scatter plot of performance vs consistency"""
-		methods = list(self.results.keys())
-		avg_makespans = [self.results[method]['avg_makespan'] for method in methods]
-		std_makespans = [self.results[method]['std_makespan'] for method in methods]
+		avg_makespans = self._avg
+		std_makespans = self._std
 
 		# Create scatter plot
-		for method, avg, std in zip(methods, avg_makespans, std_makespans):
-			color = self.colors.get(method, '#696969')
-			size = 150 if method.startswith(('Hybrid', 'Adaptive')) else 100
-			alpha = 1.0 if method.startswith(('Hybrid', 'Adaptive')) else 0.7
-
+		sizes = np.where(self._is_custom, 150, 100)
+		alphas = np.where(self._is_custom, 1.0, 0.7)
+		for method, avg, std, color, size, alpha in zip(self._methods, avg_makespans, std_makespans, self._color_rgba, sizes, alphas):
 			ax.scatter(
 				avg,
 				std,
-				c=color,
+				color=color,
 				s=size,
 				alpha=alpha,
 				edgecolors='black',
@@ -319,9 +376,9 @@ class AdvancedJSSVisualizer:
 		)
 
 		# Add quadrant lines
-		if avg_makespans and std_makespans:
-			avg_x = np.mean(avg_makespans)
-			avg_y = np.mean(std_makespans)
+		if avg_makespans.size:
+			avg_x = avg_makespans.mean()
+			avg_y = std_makespans.mean()
 			ax.axhline(y=avg_y, color='gray', linestyle='--', alpha=0.5)
 			ax.axvline(x=avg_x, color='gray', linestyle='--', alpha=0.5)
 
@@ -335,9 +392,10 @@ class AdvancedJSSVisualizer:
 	def _create_improvement_analysis(self, ax):
 		"""Create improvement analysis chart"""
 		# Find best traditional method (excluding custom agents)
-		traditional_methods = [m for m in self.results.keys() if not m.startswith(('Hybrid', 'Adaptive')) and m != 'Random']
+		custom_mask = self._is_custom
+		traditional_mask = self._is_traditional
 
-		if not traditional_methods:
+		if not traditional_mask.any():
 			ax.text(
 				0.5,
 				0.5,
@@ -350,13 +408,13 @@ class AdvancedJSSVisualizer:
 			ax.set_title('Improvement Analysis', fontsize=12, fontweight='bold')
 			return
 
-		best_traditional = min(traditional_methods, key=lambda x: self.results[x]['avg_makespan'])
-		best_traditional_makespan = self.results[best_traditional]['avg_makespan']
+		traditional_idx = np.flatnonzero(traditional_mask)
+		best_idx = traditional_idx[np.argmin(self._avg[traditional_idx])]
+		best_traditional = self._methods[best_idx]
+		best_traditional_makespan = self._avg[best_idx]
 
 		# Calculate improvements
-		custom_agents = [m for m in self.results.keys() if m.startswith(('Hybrid', 'Adaptive'))]
-
-		if not custom_agents:
+		if not custom_mask.any():
 			ax.text(
 				0.5,
 				0.5,
@@ -369,33 +427,22 @@ class AdvancedJSSVisualizer:
 			ax.set_title('Improvement Analysis', fontsize=12, fontweight='bold')
 			return
 
-		improvements = []
-		agent_names = []
+		agent_names = self._methods[custom_mask]
+		improvements = (best_traditional_makespan - self._avg[custom_mask]) / best_traditional_makespan * 100.0
 
-		for agent in custom_agents:
-			agent_makespan = self.results[agent]['avg_makespan']
-			improvement = ((best_traditional_makespan - agent_makespan) / best_traditional_makespan) * 100
-			improvements.append(improvement)
-			agent_names.append(agent)
+		# Color positive improvements green, negative red
+		colors = np.where(improvements > 0, '#2E8B57', '#DC143C').tolist()
 
 		# Create bar chart
-		colors = [self.colors.get(agent, '#696969') for agent in agent_names]
 		bars = ax.bar(
 			agent_names,
 			improvements,
 			color=colors,
 			alpha=0.8,
-			edgecolor='black',
+			edgecolor=colors,
 			linewidth=1,
 		)
 
-		# Color positive improvements green, negative red
-		for bar, imp in zip(bars, improvements):
-			if imp > 0:
-				bar.set_color('#2E8B57')  # Green for improvement
-			else:
-				bar.set_color('#DC143C')  # Red for degradation
-
 		ax.set_ylabel('Improvement (%)', fontsize=10, fontweight='bold')
 		ax.set_title(
 			f'Improvement vs Best Traditional\n({best_traditional})',
@@ -408,64 +455,49 @@ class AdvancedJSSVisualizer:
 		ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
 
 		# Add value labels
-		for bar, imp in zip(bars, improvements):
-			height = bar.get_height()
-			ax.text(
-				bar.get_x() + bar.get_width() / 2.0,
-				height + (0.5 if height >= 0 else -1),
-				f'{imp:.1f}%',
-				ha='center',
-				va='bottom' if height >= 0 else 'top',
-				fontweight='bold',
-				fontsize=9,
-			)
+		ax.bar_label(bars, labels=[f'{imp:.1f}%' for imp in improvements], padding=3, fontweight='bold', fontsize=9)
 
 		ax.grid(True, alpha=0.3)
 
+	@staticmethod
+	def _minmax_normalize(data: np.ndarray) -> np.ndarray:
+		"""Scale each column of a 2D array to [0, 1]; constant columns map to 0.5"""
+		col_min = data.min(axis=0)
+		col_range = data.max(axis=0) - col_min
+		constant = col_range == 0
+		col_range[constant] = 1.0
+
+		# In-place ops keep this to a single (N, S) temporary
+		out = np.subtract(data, col_min)
+		out /= col_range
+		out[:, constant] = 0.5
+		return out
+
 	def _create_statistics_heatmap(self, ax):
 		"""Create statistics heatmap"""
-		methods = list(self.results.keys())
+		methods = self._methods
 
 		# Prepare data for heatmap
-		stats_data = []
-		for method in methods:
-			stats = self.results[method]
-			stats_data.append([
-				stats['avg_makespan'],
-				stats['std_makespan'],
-				stats['min_makespan'],
-				stats['max_makespan'],
-				stats['avg_execution_time'] * 1000,  # Convert to ms
-			])
-
-		stats_df = pd.DataFrame(
-			stats_data,
-			index=methods,
-			columns=[
-				'Avg Makespan',
-				'Std Makespan',
-				'Min Makespan',
-				'Max Makespan',
-				'Avg Time (ms)',
-			],
-		)
+		stats_data = np.column_stack((
+			self._avg,
+			self._std,
+			np.fromiter((self.results[m]['min_makespan'] for m in methods), dtype=np.float64, count=len(methods)),
+			np.fromiter((self.results[m]['max_makespan'] for m in methods), dtype=np.float64, count=len(methods)),
+			np.fromiter((self.results[m]['avg_execution_time'] * 1000 for m in methods), dtype=np.float64, count=len(methods)),  # Convert to ms
+		))
 
 		# Normalize data for better visualization
-		stats_normalized = stats_df.copy()
-		for col in stats_df.columns:
-			col_min, col_max = stats_df[col].min(), stats_df[col].max()
-			if col_max != col_min:
-				stats_normalized[col] = (stats_df[col] - col_min) / (col_max - col_min)
-			else:
-				stats_normalized[col] = 0.5  # If all values are the same
+		stats_normalized = self._minmax_normalize(stats_data)
 
 		# Create heatmap
 		sns.heatmap(
 			stats_normalized,
-			annot=stats_df.round(1),
+			annot=np.round(stats_data, 1),
 			fmt='g',
 			cmap='RdYlGn_r',
 			ax=ax,
+			xticklabels=self._HEATMAP_COLUMNS,
+			yticklabels=methods.tolist(),
 			cbar_kws={'label': 'Normalized Score'},
 		)
 
@@ -482,12 +514,11 @@ class AdvancedJSSVisualizer:
 		ax.axis('off')
 
 		# Get top performers
-		methods = list(self.results.keys())
-		sorted_methods = sorted(methods, key=lambda x: self.results[x]['avg_makespan'])
+		top_methods = self._methods[self._top_k(5)]
 
 		# Create table data with simple text
 		table_data = []
-		for i, method in enumerate(sorted_methods[:5]):  # Top 5
+		for i, method in enumerate(top_methods):  # Top 5
 			stats = self.results[method]
 
 			# Simple ranking without special characters
@@ -543,71 +574,68 @@ class AdvancedJSSVisualizer:
 
 	def create_detailed_comparison(self, save_path: str = None):
 		"""Create detailed comparison charts"""
-		fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-		fig.suptitle(
-			f'Detailed JSS Performance Analysis - {self.instance_name}',
-			fontsize=16,
-			fontweight='bold',
-		)
+		with plt.rc_context(self._style_rc()):
+			fig = self._new_figure(figsize=(16, 12))
+			axes = fig.subplots(2, 2)
+			fig.suptitle(
+				f'Detailed JSS Performance Analysis - {self.instance_name}',
+				fontsize=16,
+				fontweight='bold',
+			)
 
-		# 1. Episode-by-episode performance
-		self._create_episode_performance(axes[0, 0])
+			# 1. Episode-by-episode performance
+			self._create_episode_performance(axes[0, 0])
 
-		# 2. Box plot comparison
-		self._create_enhanced_boxplot(axes[0, 1])
+			# 2. Box plot comparison
+			self._create_enhanced_boxplot(axes[0, 1])
 
-		# 3. Cumulative performance
-		self._create_cumulative_performance(axes[1, 0])
+			# 3. Cumulative performance
+			self._create_cumulative_performance(axes[1, 0])
 
-		# 4. Statistical significance
-		self._create_statistical_analysis(axes[1, 1])
+			# 4. Statistical significance
+			self._create_statistical_analysis(axes[1, 1])
 
-		plt.tight_layout()
+			fig.tight_layout()
 
-		if save_path:
-			plt.savefig(save_path, dpi=300, bbox_inches='tight')
-			print(f'📊 Detailed comparison saved to {save_path}')
+			if save_path:
+				fig.savefig(save_path, dpi=300, bbox_inches='tight', **self._png_save_kwargs(save_path))
+				print(f'📊 Detailed comparison saved to {save_path}')
 
 		return fig
 
-	def _create_episode_performance(self, ax):
-		"""Create episode-by-episode performance chart"""
-		for method in self.results.keys():
-			makespans = self.results[method]['all_makespans']
-			episodes = range(1, len(makespans) + 1)
+	def _draw_method_lines(self, ax, methods, series, marker: str = None):
+		"""Draw one per-episode line per method as a single LineCollection, with proxy legend handles"""
+		colors = self._color_rgba.copy()
+		colors[:, 3] = np.where(self._is_custom, 1.0, 0.6)
+		linewidths = np.where(self._is_custom, 2, 1)
 
-			color = self.colors.get(method, '#696969')
-			alpha = 1.0 if method.startswith(('Hybrid', 'Adaptive')) else 0.6
-			linewidth = 2 if method.startswith(('Hybrid', 'Adaptive')) else 1
+		segments = [np.column_stack((np.arange(1, len(values) + 1), values)) for values in series]
+		ax.add_collection(LineCollection(segments, colors=colors, linewidths=linewidths))
 
-			ax.plot(
-				episodes,
-				makespans,
-				label=method,
-				color=color,
-				alpha=alpha,
-				linewidth=linewidth,
-				marker='o',
-				markersize=3,
-			)
+		if marker and segments:
+			# All markers in one scatter collection, coloured per point by method
+			points = np.concatenate(segments)
+			point_colors = np.repeat(colors, [len(segment) for segment in segments], axis=0)
+			ax.scatter(points[:, 0], points[:, 1], c=point_colors, marker=marker, s=9)
+
+		ax.autoscale_view()
+
+		handles = [Line2D([], [], color=color, linewidth=linewidth, marker=marker, markersize=3, label=method) for method, color, linewidth in zip(methods, colors, linewidths)]
+		ax.legend(handles=handles, bbox_to_anchor=(1.05, 1), loc='upper left')
+
+	def _create_episode_performance(self, ax):
+		"""Create episode-by-episode performance chart"""
+		methods, all_makespans, _, _ = self._prepare_episode_data()
+		self._draw_method_lines(ax, methods, all_makespans, marker='o')
 
 		ax.set_xlabel('Episode', fontweight='bold')
 		ax.set_ylabel('Makespan', fontweight='bold')
 		ax.set_title('Episode-by-Episode Performance', fontweight='bold')
-		ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
 		ax.grid(True, alpha=0.3)
 
 	def _create_enhanced_boxplot(self, ax):
 		"""Create enhanced box plot"""
-		makespan_data = []
-		labels = []
-
-		for method in self.results.keys():
-			makespans = self.results[method]['all_makespans']
-			makespan_data.extend(makespans)
-			labels.extend([method] * len(makespans))
-
-		df = pd.DataFrame({'Method': labels, 'Makespan': makespan_data})
+		_, _, _, df = self._prepare_episode_data()
 
 		# Create box plot with version compatibility
 		try:
@@ -618,7 +646,7 @@ class AdvancedJSSVisualizer:
 				y='Makespan',
 				ax=ax,
 				hue='Method',
-				palette=[self.colors.get(m, '#696969') for m in df['Method'].unique()],
+				palette=list(self._color_rgba),
 				legend=False,
 			)
 		except Exception:
@@ -629,7 +657,7 @@ class AdvancedJSSVisualizer:
 					x='Method',
 					y='Makespan',
 					ax=ax,
-					palette=[self.colors.get(m, '#696969') for m in df['Method'].unique()],
+					palette=list(self._color_rgba),
 				)
 			except Exception:
 				# Ultimate fallback
@@ -637,9 +665,8 @@ class AdvancedJSSVisualizer:
 
 		# Highlight custom agents with error handling
 		try:
-			unique_methods = df['Method'].unique()
-			for i, method in enumerate(unique_methods):
-				if method.startswith(('Hybrid', 'Adaptive')) and hasattr(ax, 'artists') and i < len(ax.artists):
+			for i in np.flatnonzero(self._is_custom):
+				if hasattr(ax, 'artists') and i < len(ax.artists):
 					ax.artists[i].set_edgecolor('gold')
 					ax.artists[i].set_linewidth(2)
 		except (IndexError, AttributeError):
@@ -652,72 +679,49 @@ class AdvancedJSSVisualizer:
 
 	def _create_cumulative_performance(self, ax):
 		"""Create cumulative performance chart"""
-		for method in self.results.keys():
-			makespans = self.results[method]['all_makespans']
-			cumulative_avg = np.cumsum(makespans) / np.arange(1, len(makespans) + 1)
-			episodes = range(1, len(makespans) + 1)
-
-			color = self.colors.get(method, '#696969')
-			alpha = 1.0 if method.startswith(('Hybrid', 'Adaptive')) else 0.6
-			linewidth = 2 if method.startswith(('Hybrid', 'Adaptive')) else 1
-
-			ax.plot(
-				episodes,
-				cumulative_avg,
-				label=method,
-				color=color,
-				alpha=alpha,
-				linewidth=linewidth,
-			)
+		methods, makespans, makespan_matrix, _ = self._prepare_episode_data()
+		if makespan_matrix is not None:
+			# Uniform episode counts: one cumsum over the whole (methods, episodes) block
+			cumulative_avgs = np.cumsum(makespan_matrix, axis=1) / np.arange(1, makespan_matrix.shape[1] + 1)
+		else:
+			cumulative_avgs = [np.cumsum(a) / np.arange(1, a.size + 1) for a in makespans]
+
+		self._draw_method_lines(ax, methods, cumulative_avgs)
 
 		ax.set_xlabel('Episode', fontweight='bold')
 		ax.set_ylabel('Cumulative Average Makespan', fontweight='bold')
 		ax.set_title('Cumulative Performance Convergence', fontweight='bold')
-		ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
 		ax.grid(True, alpha=0.3)
 
 	def _create_statistical_analysis(self, ax):
 		"""Create statistical analysis visualization"""
-		methods = list(self.results.keys())
+		methods, makespans, makespan_matrix, _ = self._prepare_episode_data()
 
-		# Calculate confidence intervals
-		means = []
-		ci_lower = []
-		ci_upper = []
-
-		for method in methods:
-			makespans = np.array(self.results[method]['all_makespans'])
-			mean = np.mean(makespans)
-			std_err = np.std(makespans) / np.sqrt(len(makespans))
-			ci = 1.96 * std_err  # 95% confidence interval
-
-			means.append(mean)
-			ci_lower.append(mean - ci)
-			ci_upper.append(mean + ci)
+		# Calculate 95% confidence intervals
+		if makespan_matrix is not None:
+			means = makespan_matrix.mean(axis=1)
+			ci = 1.96 * makespan_matrix.std(axis=1) / np.sqrt(makespan_matrix.shape[1])
+		else:
+			means = np.array([a.mean() for a in makespans])
+			ci = 1.96 * np.array([a.std() / np.sqrt(a.size) for a in makespans])
 
 		# Create error bar plot
 		x_pos = range(len(methods))
-		colors = [self.colors.get(m, '#696969') for m in methods]
-
 		bars = ax.bar(
 			x_pos,
 			means,
-			yerr=[
-				np.array(means) - np.array(ci_lower),
-				np.array(ci_upper) - np.array(means),
-			],
+			yerr=np.vstack([ci, ci]),
 			capsize=5,
-			color=colors,
+			color=self._color_rgba,
 			alpha=0.7,
 			edgecolor='black',
 		)
 
 		# Highlight custom agents
-		for i, method in enumerate(methods):
-			if method.startswith(('Hybrid', 'Adaptive')):
-				bars[i].set_alpha(1.0)
-				bars[i].set_edgecolor('gold')
-				bars[i].set_linewidth(2)
+		for i in np.flatnonzero(self._is_custom):
+			bars[i].set_alpha(1.0)
+			bars[i].set_edgecolor('gold')
+			bars[i].set_linewidth(2)
 
 		ax.set_xticks(x_pos)
 		ax.set_xticklabels(methods, rotation=45, ha='right')
@@ -727,24 +731,25 @@ class AdvancedJSSVisualizer:
 
 	def create_gantt_charts_for_agents(self, gantt_data: Dict, save_dir: str = 'results'):
 		"""Create Gantt charts for custom agents"""
-		from pathlib import Path
+		with plt.rc_context(self._style_rc()):
+			from pathlib import Path
 
-		# Create gantt charts directory
-		gantt_dir = Path(save_dir) / 'gantt_charts'
-		gantt_dir.mkdir(exist_ok=True)
+			# Create gantt charts directory
+			gantt_dir = Path(save_dir) / 'gantt_charts'
+			gantt_dir.mkdir(exist_ok=True)
 
-		for agent_name, data in gantt_data.items():
-			schedule = data['schedule']
-			makespan = data['makespan']
+			for agent_name, data in gantt_data.items():
+				schedule = data['schedule']
+				makespan = data['makespan']
 
-			# Create individual Gantt chart
-			self._create_single_gantt_chart(agent_name, schedule, makespan, str(gantt_dir))
+				# Create individual Gantt chart
+				self._create_single_gantt_chart(agent_name, schedule, makespan, str(gantt_dir))
 
-		# Create comparison Gantt chart
-		if len(gantt_data) > 1:
-			self._create_comparison_gantt_chart(gantt_data, str(gantt_dir))
+			# Create comparison Gantt chart
+			if len(gantt_data) > 1:
+				self._create_comparison_gantt_chart(gantt_data, str(gantt_dir))
 
-		print(f'🎯 Gantt charts saved to {gantt_dir}')
+			print(f'🎯 Gantt charts saved to {gantt_dir}')
 
 	def _create_single_gantt_chart(self, agent_name: str, schedule: List, makespan: float, save_dir: str):
 		"""Create a single Gantt chart for one agent"""
@@ -752,11 +757,8 @@ class AdvancedJSSVisualizer:
 			print(f'Warning: No schedule data for {agent_name}')
 			return
 
-		# Apply ControllerJSSAgent styling
-		plt.style.use('seaborn-v0_8-whitegrid')
-		sns.set_palette('husl')
-
-		fig, ax = plt.subplots(figsize=(12, 8))
+		fig = self._new_figure(figsize=(12, 8))
+		ax = fig.subplots()
 
 		# Get unique machines and jobs
 		machines = sorted(list(set(task[1] for task in schedule)))
@@ -793,25 +795,21 @@ class AdvancedJSSVisualizer:
 
 		# Add legend using mpatches like ControllerJSSAgent
 		job_patches = [mpatches.Patch(color=job_colors[job], label=f'Job {job}') for job in sorted(jobs)]
-		plt.legend(handles=job_patches, bbox_to_anchor=(1.05, 1), loc='upper left')
+		ax.legend(handles=job_patches, bbox_to_anchor=(1.05, 1), loc='upper left')
 
-		plt.tight_layout()
+		fig.tight_layout()
 
 		# Save the chart
 		filename = f'{agent_name.replace(" ", "_")}_gantt.png'
 		filepath = Path(save_dir) / filename
-		plt.savefig(filepath, dpi=300, bbox_inches='tight')
-		plt.close()
+		fig.savefig(filepath, dpi=300, bbox_inches='tight')
 
 		print(f'📊 Gantt chart for {agent_name} saved to {filepath}')
 
 	def _create_comparison_gantt_chart(self, gantt_data: Dict, save_dir: str):
 		"""Create a comparison Gantt chart showing both agents side by side"""
-		# Apply ControllerJSSAgent styling
-		plt.style.use('seaborn-v0_8-whitegrid')
-		sns.set_palette('husl')
-
-		fig, axes = plt.subplots(len(gantt_data), 1, figsize=(12, 6 * len(gantt_data)))
+		fig = self._new_figure(figsize=(12, 6 * len(gantt_data)))
+		axes = fig.subplots(len(gantt_data), 1)
 
 		if len(gantt_data) == 1:
 			axes = [axes]  # Make it iterable for single plot
@@ -886,11 +884,10 @@ class AdvancedJSSVisualizer:
 		# Add common x-label to the bottom subplot
 		axes[-1].set_xlabel('Time')
 
-		plt.tight_layout()
+		fig.tight_layout()
 
 		# Save the comparison chart
 		filepath = Path(save_dir) / 'custom_agents_gantt_comparison.png'
-		plt.savefig(filepath, dpi=300, bbox_inches='tight')
-		plt.close()
+		fig.savefig(filepath, dpi=300, bbox_inches='tight')
 
 		print(f'📊 Comparison Gantt chart saved to {filepath}')
@@ -33,6 +33,8 @@ class HybridPriorityScoringAgent(BaseJSSAgent):
 		self.episode_step = 0
 		self.total_jobs = 0
 		self.total_machines = 0
+		self._remaining_work_matrix = None
+		self._remaining_work_source = None
 
 	def __call__(self, env: JssEnv, obs: Dict[str, np.ndarray]) -> int:
 		# Handle observation format
@@ -56,19 +58,14 @@ class HybridPriorityScoringAgent(BaseJSSAgent):
 		progress_ratio = self._calculate_progress_ratio(env)
 
 		# Get legal job indices
-		legal_job_indices = [i for i in range(env.jobs) if legal_actions[i]]
+		legal_job_indices = np.flatnonzero(np.asarray(legal_actions[: env.jobs]))
 
-		if not legal_job_indices:
+		if not legal_job_indices.size:
 			return env.jobs if legal_actions[env.jobs] else 0
 
-		# Calculate composite scores for each legal job
-		job_scores = {}
-		for job_idx in legal_job_indices:
-			score = self._calculate_job_score(env, job_idx, progress_ratio)
-			job_scores[job_idx] = score
-
-		# Select best job (highest score)
-		best_job = max(job_scores.keys(), key=lambda x: job_scores[x])
+		# Score every legal job at once and select the best (highest score, lowest index on ties)
+		job_scores = self._calculate_job_scores(env, legal_job_indices, progress_ratio)
+		best_job = int(legal_job_indices[np.argmax(job_scores)])
 
 		# Occasionally consider no-op if it's legal and we're early in schedule
 		if legal_actions[env.jobs] and progress_ratio < 0.3 and np.random.random() < 0.05:
@@ -82,94 +79,58 @@ class HybridPriorityScoringAgent(BaseJSSAgent):
 		total_ops = env.jobs * env.machines
 		return completed_ops / total_ops if total_ops > 0 else 0.0
 
-	def _calculate_job_score(self, env: JssEnv, job_idx: int, progress_ratio: float) -> float:
-		"""Calculate composite priority score for a job"""
-
-		# Get job information
-		current_op = env.todo_time_step_job[job_idx]
-		current_machine = env.needed_machine_jobs[job_idx]
-		current_proc_time = env.instance_matrix[job_idx][current_op][1]
-
-		# Calculate various heuristic components
-		spt_score = self._shortest_processing_time_score(current_proc_time, env.max_time_op)
-
-		work_remaining_score = self._work_remaining_score(env, job_idx)
-
-		critical_path_score = self._critical_path_score(env, job_idx)
-
-		machine_utilization_score = self._machine_utilization_score(env, current_machine)
-
-		bottleneck_score = self._bottleneck_machine_score(env, job_idx, current_op)
-
-		flow_continuity_score = self._flow_continuity_score(env, job_idx, current_op)
+	def _remaining_work(self, env: JssEnv) -> np.ndarray:
+		"""Per (job, op) processing time left from that op onwards; computed once per environment"""
+		if self._remaining_work_matrix is None or self._remaining_work_source is not env.instance_matrix:
+			proc_times = env.instance_matrix[:, :, 1]
+			self._remaining_work_matrix = np.cumsum(proc_times[:, ::-1], axis=1)[:, ::-1]
+			self._remaining_work_source = env.instance_matrix
+		return self._remaining_work_matrix
+
+	def _calculate_job_scores(self, env: JssEnv, jobs: np.ndarray, progress_ratio: float) -> np.ndarray:
+		"""Composite priority scores for the given jobs, one heuristic per array"""
+		max_time = env.max_time_op
+		current_op = env.todo_time_step_job[jobs]
+		current_machine = env.needed_machine_jobs[jobs]
+		current_proc_time = env.instance_matrix[jobs, current_op, 1]
+
+		# Shortest processing time: higher score for shorter processing times
+		spt_score = 1.0 - (current_proc_time / max_time)
+
+		# Work remaining: more work = higher score
+		work_remaining_score = self._remaining_work(env)[jobs, current_op] / (max_time * env.machines)
+
+		# Critical path: jobs with more operations remaining are more critical early on
+		critical_path_score = (env.machines - current_op) / env.machines
+
+		# Machine utilization: prefer machines that are available sooner
+		machine_available_time = env.time_until_available_machine[current_machine]
+		if max_time > 0:
+			machine_utilization_score = 1.0 - (machine_available_time / max_time)
+		else:
+			machine_utilization_score = np.ones(jobs.size)
+
+		# Bottleneck: share of legal jobs that need the same machine as this job's operation
+		legal_jobs = np.asarray(env.legal_actions[: env.jobs], dtype=bool)
+		machine_demand = np.bincount(env.needed_machine_jobs[legal_jobs], minlength=env.machines)
+		bottleneck_score = machine_demand[env.instance_matrix[jobs, current_op, 0]] / env.jobs
+
+		# Flow continuity: will the next operation's machine be free when this one finishes?
+		is_last = current_op >= env.machines - 1
+		next_op = np.where(is_last, current_op, current_op + 1)
+		next_machine_available_time = env.time_until_available_machine[env.instance_matrix[jobs, next_op, 0]]
+		wait_time = next_machine_available_time - current_proc_time
+		flow_continuity_score = np.where(
+			is_last | (wait_time <= 0),
+			1.0,
+			# Penalize based on waiting time
+			np.maximum(0.0, 1.0 - (wait_time / max_time)),
+		)
 
 		# Dynamic weight adjustment based on progress
 		weights = self._get_dynamic_weights(progress_ratio, env)
 
-		# Composite score
-		composite_score = weights['spt'] * spt_score + weights['work_remaining'] * work_remaining_score + weights['critical_path'] * critical_path_score + weights['machine_util'] * machine_utilization_score + weights['bottleneck'] * bottleneck_score + weights['flow_continuity'] * flow_continuity_score
-
-		return composite_score
-
-	def _shortest_processing_time_score(self, proc_time: int, max_time: int) -> float:
-		"""Higher score for shorter processing times"""
-		return 1.0 - (proc_time / max_time)
-
-	def _work_remaining_score(self, env: JssEnv, job_idx: int) -> float:
-		"""Score based on remaining work - prioritize jobs with more work early, less work late"""
-		remaining_work = 0
-		for op in range(env.todo_time_step_job[job_idx], env.machines):
-			remaining_work += env.instance_matrix[job_idx][op][1]
-
-		max_possible_work = env.max_time_op * env.machines
-		normalized_remaining = remaining_work / max_possible_work
-
-		return normalized_remaining  # More work = higher score
-
-	def _critical_path_score(self, env: JssEnv, job_idx: int) -> float:
-		"""Score based on critical path considerations"""
-		remaining_ops = env.machines - env.todo_time_step_job[job_idx]
-		max_remaining_ops = env.machines
-
-		# Jobs with more operations remaining are more critical early on
-		return remaining_ops / max_remaining_ops
-
-	def _machine_utilization_score(self, env: JssEnv, machine_id: int) -> float:
-		"""Score based on machine availability and utilization"""
-		machine_available_time = env.time_until_available_machine[machine_id]
-
-		# Prefer machines that are available sooner
-		if env.max_time_op > 0:
-			return 1.0 - (machine_available_time / env.max_time_op)
-		return 1.0
-
-	def _bottleneck_machine_score(self, env: JssEnv, job_idx: int, current_op: int) -> float:
-		"""Identify and prioritize jobs that will use bottleneck machines"""
-		current_machine = env.instance_matrix[job_idx][current_op][0]
-
-		# Count how many legal jobs need this machine
-		machine_demand = sum(1 for j in range(env.jobs) if env.legal_actions[j] and env.needed_machine_jobs[j] == current_machine)
-
-		# Higher demand = higher bottleneck score
-		return machine_demand / env.jobs
-
-	def _flow_continuity_score(self, env: JssEnv, job_idx: int, current_op: int) -> float:
-		"""Score based on flow continuity - can the job continue to next operation smoothly?"""
-		if current_op >= env.machines - 1:  # Last operation
-			return 1.0
-
-		# Check next operation machine availability
-		next_machine = env.instance_matrix[job_idx][current_op + 1][0]
-		next_machine_available_time = env.time_until_available_machine[next_machine]
-		current_proc_time = env.instance_matrix[job_idx][current_op][1]
-
-		# If next machine will be available when current op finishes, higher score
-		if next_machine_available_time <= current_proc_time:
-			return 1.0
-		else:
-			# Penalize based on waiting time
-			wait_time = next_machine_available_time - current_proc_time
-			return max(0.0, 1.0 - (wait_time / env.max_time_op))
+		return weights['spt'] * spt_score + weights['work_remaining'] * work_remaining_score + weights['critical_path'] * critical_path_score + weights['machine_util'] * machine_utilization_score + weights['bottleneck'] * bottleneck_score + weights['flow_continuity'] * flow_continuity_score
 
 	def _get_dynamic_weights(self, progress_ratio: float, env: JssEnv) -> Dict[str, float]:
 		"""Adjust heuristic weights based on scheduling progress and problem characteristics"""
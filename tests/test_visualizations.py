@@ -0,0 +1,69 @@
+"""
+Comparison chart rendering through the execution service's render pool
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from api.schemas.jss_schemas import ComparisonRequest
+from api.services.jss_service import JSSExecutionService, JSSFileService
+from comparison_framework.comparison_framework import JSSPerformanceMetrics
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def _method_stats(episodes):
+	"""Per-method summary stats shaped like the ones comparison workers return"""
+	stats = {}
+	for method, makespans in episodes.items():
+		metrics = JSSPerformanceMetrics()
+		for makespan in makespans:
+			metrics.add_episode_result(makespan, -makespan / 100.0, 0.05)
+		stats[method] = metrics.get_summary_stats()
+	return stats
+
+
+@pytest.fixture
+def execution_service(tmp_path):
+	instances_dir = tmp_path / 'instances'
+	controllers_dir = tmp_path / 'controllers'
+	results_dir = tmp_path / 'results'
+	service = JSSExecutionService(JSSFileService(str(instances_dir), str(controllers_dir), str(results_dir)))
+	yield service
+	service.shutdown()
+
+
+def test_comparison_visualizations_render_png(execution_service):
+	request = ComparisonRequest(instance_name='ta01', num_episodes=3, include_visualizations=True)
+	method_stats = _method_stats({
+		'HybridPriorityScoring': [1320, 1295, 1310],
+		'SPT': [1460, 1460, 1460],
+		'FIFO': [1530, 1530, 1530],
+		'Random': [1710, 1655, 1698],
+	})
+	result = JSSExecutionService._summarize_comparison(request, method_stats, 1, 0.0)
+
+	asyncio.run(execution_service._generate_visualizations_for_result(result, method_stats))
+
+	(results_subdir,) = execution_service.file_service.results_dir.iterdir()
+	for chart in ('comprehensive_dashboard.png', 'detailed_comparison.png'):
+		with open(results_subdir / chart, 'rb') as f:
+			assert f.read(len(PNG_SIGNATURE)) == PNG_SIGNATURE
+
+
+def test_failed_render_leaves_no_results_directory(execution_service):
+	request = ComparisonRequest(instance_name='ta01', num_episodes=1, include_visualizations=True)
+	method_stats = _method_stats({'SPT': [1460], 'Random': [1710]})
+	result = JSSExecutionService._summarize_comparison(request, method_stats, 0, 0.0)
+	# Without per-episode makespans there is nothing to plot
+	for stats in method_stats.values():
+		del stats['all_makespans']
+
+	asyncio.run(execution_service._generate_visualizations_for_result(result, method_stats))
+
+	assert list(execution_service.file_service.results_dir.iterdir()) == []